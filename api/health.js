@@ -0,0 +1,17 @@
+/**
+ * Health check (Vercel Edge Runtime).
+ *
+ * Responde sin arrancar la función Python, así las sondas de salud
+ * no pagan el arranque en frío de FastAPI.
+ */
+
+export const config = { runtime: 'edge' };
+
+export default function handler() {
+    // UTC con resolución de segundos, como /api/health en web/app.py
+    const timestamp = new Date().toISOString().slice(0, 19) + 'Z';
+    return new Response(
+        JSON.stringify({ status: 'healthy', timestamp }),
+        { headers: { 'content-type': 'application/json' } }
+    );
+}
@@ -16,12 +16,14 @@ Ejemplos de preguntas:
     - "¿Cuál es el 15% de 1500?"
 """
 
+import os
 import sys
 import argparse
 from typing import NoReturn
 
-# Agregar el directorio raíz al path
-sys.path.insert(0, ".")
+# Agregar el directorio del script al path (sin depender del directorio actual
+# ni de que el proyecto esté instalado)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.agents import CalculatorSearchAgent
 from src.config.settings import settings
@@ -12,8 +12,7 @@ Uso rapido:
     print(response)  # 30
 """
 
-from src.agents import CalculatorSearchAgent, create_agent
-from src.config.settings import settings
+from src._lazy import lazy_module
 
 __version__ = "1.0.0"
 __author__ = "Tu Nombre"
@@ -23,3 +22,13 @@ __all__ = [
     "create_agent",
     "settings",
 ]
+
+# Exportaciones perezosas (PEP 562): el agente y la configuracion se
+# importan en el primer acceso, no al hacer `import src`.
+_LAZY = {
+    "CalculatorSearchAgent": "src.agents",
+    "create_agent": "src.agents",
+    "settings": "src.config.settings",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY)
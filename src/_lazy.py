@@ -0,0 +1,48 @@
+"""
+Exportaciones perezosas (PEP 562) para los paquetes del proyecto.
+
+Cada paquete declara que simbolo viene de que modulo y lo importa en el
+primer acceso, asi `import src` (o `src.tools`, etc.) no carga langchain,
+langgraph ni las dependencias de las herramientas.
+
+Uso (en el __init__ de un paquete):
+    from src._lazy import lazy_module
+
+    _LAZY = {"CalculatorSearchAgent": "src.agents.calculator_agent"}
+    __getattr__, __dir__ = lazy_module(__name__, _LAZY)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_module(
+    name: str, mapping: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Crea el __getattr__ y el __dir__ de un paquete con exportaciones perezosas.
+
+    El simbolo se obtiene siempre de su modulo y no se guarda en los globals
+    del paquete: importar un submodulo lo enlaza como atributo del paquete
+    (p. ej. src.tools.wikipedia_tool) y taparia al simbolo del mismo nombre.
+
+    Args:
+        name: __name__ del paquete
+        mapping: Nombre del simbolo -> modulo que lo define
+
+    Returns:
+        Tupla (__getattr__, __dir__) para asignar en el paquete
+    """
+
+    def __getattr__(attr: str) -> Any:
+        try:
+            module_name = mapping[attr]
+        except KeyError:
+            raise AttributeError(f"module {name!r} has no attribute {attr!r}") from None
+        return getattr(importlib.import_module(module_name), attr)
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[name])) | set(mapping))
+
+    return __getattr__, __dir__
@@ -10,12 +10,18 @@ Uso:
     response = agent.run("Cuanto es 15% de 200?")
 """
 
-from src.agents.calculator_agent import (
-    CalculatorSearchAgent,
-    create_agent,
-)
+from src._lazy import lazy_module
 
 __all__ = [
     "CalculatorSearchAgent",
     "create_agent",
 ]
+
+# Exportaciones perezosas (PEP 562): calculator_agent (y con ello langchain
+# y langgraph) solo se importa cuando se usa alguno de sus simbolos.
+_LAZY = {
+    "CalculatorSearchAgent": "src.agents.calculator_agent",
+    "create_agent": "src.agents.calculator_agent",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY)
@@ -20,12 +20,13 @@ Ejemplo de uso:
     print(response)
 """
 
-from typing import Optional, List
-from langchain_openai import ChatOpenAI
-from langgraph.prebuilt import create_react_agent
+from typing import Any, Iterator, Optional, List
 
 from src.config.settings import settings
-from src.tools import get_all_tools
+
+
+# Indica si ya se registro la cache global de respuestas del LLM
+_llm_cache_configured = False
 
 
 # System prompt para el agente
@@ -95,6 +96,20 @@ class CalculatorSearchAgent:
 
     def _setup_llm(self) -> None:
         """Configura el modelo de lenguaje DeepSeek."""
+        # Import diferido: langchain_openai es pesado y solo se necesita
+        # al construir el agente, no al importar la clase.
+        from langchain_openai import ChatOpenAI
+
+        # Cache en memoria de respuestas del LLM (compartida por proceso):
+        # prompts identicos no vuelven a llamar a la API de DeepSeek.
+        global _llm_cache_configured
+        if not _llm_cache_configured:
+            from langchain_core.caches import InMemoryCache
+            from langchain_core.globals import set_llm_cache
+
+            set_llm_cache(InMemoryCache())
+            _llm_cache_configured = True
+
         self.llm = ChatOpenAI(
             model=self.model,
             openai_api_key=self.api_key,
@@ -107,6 +122,9 @@ class CalculatorSearchAgent:
 
     def _setup_tools(self) -> None:
         """Configura las herramientas del agente."""
+        # Los modulos de herramientas (y langchain.tools) se cargan aqui
+        from src.tools import get_all_tools
+
         self.tools = get_all_tools(
             serpapi_key=settings.SERPAPI_API_KEY,
             wikipedia_lang="es"
@@ -118,6 +136,8 @@ class CalculatorSearchAgent:
 
     def _setup_agent(self) -> None:
         """Configura el agente ReAct usando langgraph."""
+        from langgraph.prebuilt import create_react_agent
+
         # Crear el agente ReAct con langgraph
         self.agent = create_react_agent(
             model=self.llm,
@@ -199,6 +219,29 @@ class CalculatorSearchAgent:
                 "messages": []
             }
 
+    def stream(self, query: str) -> Iterator[Any]:
+        """
+        Ejecuta una consulta entregando los mensajes a medida que se generan.
+
+        A diferencia de run_with_steps, no espera a que termine el agente:
+        cada mensaje (del LLM o de una herramienta) se entrega en cuanto
+        el nodo correspondiente de langgraph lo produce.
+
+        Args:
+            query: La pregunta o tarea para el agente
+
+        Yields:
+            Cada mensaje nuevo del agente, en orden
+        """
+        updates = self.agent.stream(
+            {"messages": [("user", query)]},
+            config={"recursion_limit": self.max_iterations},
+            stream_mode="updates",
+        )
+        for update in updates:
+            for node_output in update.values():
+                yield from (node_output or {}).get("messages", [])
+
     def get_tools_info(self) -> List[dict]:
         """
         Obtiene informacion sobre las herramientas disponibles.
@@ -4,9 +4,17 @@ Configuracion del proyecto.
 Este modulo exporta la configuracion centralizada.
 """
 
-from src.config.settings import settings, TOOL_DESCRIPTIONS
+from src._lazy import lazy_module
+from src.config.settings import settings
 
 __all__ = [
     "settings",
     "TOOL_DESCRIPTIONS",
 ]
+
+# TOOL_DESCRIPTIONS se importa en el primer acceso (PEP 562)
+_LAZY = {
+    "TOOL_DESCRIPTIONS": "src.config._descriptions",
+}
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY)
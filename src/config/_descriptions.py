@@ -0,0 +1,41 @@
+"""
+Descripciones de las herramientas del agente.
+
+Separadas de settings.py para que importar la configuracion no cargue
+estos textos; se exportan de forma perezosa desde src.config.
+"""
+
+TOOL_DESCRIPTIONS = {
+    "calculator": """
+    Útil para realizar cálculos matemáticos.
+    Usa esta herramienta cuando necesites:
+    - Operaciones aritméticas (suma, resta, multiplicación, división)
+    - Porcentajes
+    - Potencias y raíces
+    - Cualquier expresión matemática
+
+    Input: Una expresión matemática válida en Python (ej: "25 * 4", "100 * 0.15", "2 ** 10")
+    """,
+
+    "web_search": """
+    Útil para buscar información actual en internet.
+    Usa esta herramienta cuando necesites:
+    - Información actualizada o reciente
+    - Noticias actuales
+    - Precios o cotizaciones actuales
+    - Eventos recientes
+
+    Input: Una consulta de búsqueda en texto natural
+    """,
+
+    "wikipedia": """
+    Útil para consultar información enciclopédica.
+    Usa esta herramienta cuando necesites:
+    - Biografías de personas famosas
+    - Historia de países, eventos o conceptos
+    - Definiciones y explicaciones detalladas
+    - Datos científicos o históricos
+
+    Input: El tema o término a buscar en Wikipedia
+    """
+}
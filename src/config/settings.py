@@ -13,10 +13,15 @@ Uso:
 import os
 from dataclasses import dataclass
 from typing import Optional
-from dotenv import load_dotenv
 
-# Cargar variables de entorno desde .env
-load_dotenv()
+# Cargar variables de entorno desde .env (en Vercel ya estan en el entorno,
+# asi que ni se importa dotenv ni se lee el archivo)
+if os.getenv("VERCEL") != "1":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+_env = os.environ
 
 
 @dataclass
@@ -36,22 +41,22 @@ class Settings:
     """
 
     # DeepSeek Configuration
-    DEEPSEEK_API_KEY: str = os.getenv("DEEPSEEK_API_KEY", "")
-    DEEPSEEK_MODEL: str = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
-    DEEPSEEK_API_BASE: str = os.getenv("DEEPSEEK_API_BASE", "https://api.deepseek.com")
+    DEEPSEEK_API_KEY: str = _env.get("DEEPSEEK_API_KEY", "")
+    DEEPSEEK_MODEL: str = _env.get("DEEPSEEK_MODEL", "deepseek-chat")
+    DEEPSEEK_API_BASE: str = _env.get("DEEPSEEK_API_BASE", "https://api.deepseek.com")
 
     # SerpAPI Configuration (opcional)
-    SERPAPI_API_KEY: Optional[str] = os.getenv("SERPAPI_API_KEY")
+    SERPAPI_API_KEY: Optional[str] = _env.get("SERPAPI_API_KEY")
 
     # Agent Configuration
-    AGENT_VERBOSE: bool = os.getenv("AGENT_VERBOSE", "true").lower() == "true"
-    AGENT_MAX_ITERATIONS: int = int(os.getenv("AGENT_MAX_ITERATIONS", "10"))
+    AGENT_VERBOSE: bool = _env.get("AGENT_VERBOSE", "true").lower() == "true"
+    AGENT_MAX_ITERATIONS: int = int(_env.get("AGENT_MAX_ITERATIONS", "10"))
 
     # LLM Configuration
-    LLM_TEMPERATURE: float = float(os.getenv("LLM_TEMPERATURE", "0.0"))
+    LLM_TEMPERATURE: float = float(_env.get("LLM_TEMPERATURE", "0.0"))
 
     # Logging Configuration
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _env.get("LOG_LEVEL", "INFO")
 
     def validate(self) -> bool:
         """
@@ -96,40 +101,3 @@ class Settings:
 
 # Instancia singleton de la configuración
 settings = Settings()
-
-
-# Constantes adicionales
-TOOL_DESCRIPTIONS = {
-    "calculator": """
-    Útil para realizar cálculos matemáticos.
-    Usa esta herramienta cuando necesites:
-    - Operaciones aritméticas (suma, resta, multiplicación, división)
-    - Porcentajes
-    - Potencias y raíces
-    - Cualquier expresión matemática
-
-    Input: Una expresión matemática válida en Python (ej: "25 * 4", "100 * 0.15", "2 ** 10")
-    """,
-
-    "web_search": """
-    Útil para buscar información actual en internet.
-    Usa esta herramienta cuando necesites:
-    - Información actualizada o reciente
-    - Noticias actuales
-    - Precios o cotizaciones actuales
-    - Eventos recientes
-
-    Input: Una consulta de búsqueda en texto natural
-    """,
-
-    "wikipedia": """
-    Útil para consultar información enciclopédica.
-    Usa esta herramienta cuando necesites:
-    - Biografías de personas famosas
-    - Historia de países, eventos o conceptos
-    - Definiciones y explicaciones detalladas
-    - Datos científicos o históricos
-
-    Input: El tema o término a buscar en Wikipedia
-    """
-}
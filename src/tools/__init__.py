@@ -20,25 +20,50 @@ Uso:
     tools = get_all_tools()
 """
 
-from src.tools.calculator import calculator_tool
-from src.tools.web_search import (
-    web_search_tool,
-    initialize_searcher,
-    get_search_status
-)
-from src.tools.wikipedia_tool import (
-    wikipedia_tool,
-    initialize_wikipedia,
-    get_wikipedia_status
-)
-from src.tools.datetime_tool import datetime_tool
-from src.tools.unit_converter import unit_converter_tool
-from src.tools.text_tools import (
-    text_analyzer_tool,
-    text_transform_tool,
-    random_generator_tool
+from src._lazy import lazy_module
+
+# Cada simbolo se importa desde su modulo en el primer acceso (PEP 562),
+# asi `import src.tools` no carga langchain, requests, wikipedia, etc.
+_LAZY = {
+    "calculator_tool": "src.tools.calculator",
+    "web_search_tool": "src.tools.web_search",
+    "initialize_searcher": "src.tools.web_search",
+    "initialize_searcher_async": "src.tools.web_search",
+    "get_search_status": "src.tools.web_search",
+    "wikipedia_tool": "src.tools.wikipedia_tool",
+    "wikipedia_tool_async": "src.tools.wikipedia_tool",
+    "initialize_wikipedia": "src.tools.wikipedia_tool",
+    "initialize_wikipedia_async": "src.tools.wikipedia_tool",
+    "get_wikipedia_status": "src.tools.wikipedia_tool",
+    "get_wikipedia_langchain_tool": "src.tools.wikipedia_tool",
+    "datetime_tool": "src.tools.datetime_tool",
+    "unit_converter_tool": "src.tools.unit_converter",
+    "text_analyzer_tool": "src.tools.text_tools",
+    "text_transform_tool": "src.tools.text_tools",
+    "random_generator_tool": "src.tools.text_tools",
+    "weather_tool": "src.tools.weather_tool",
+    "aweather_tool": "src.tools.weather_tool",
+}
+
+# Orden en el que get_all_tools entrega las herramientas. Las versiones
+# async (aweather_tool, wikipedia_tool_async) no se incluyen: el agente invoca
+# las herramientas de forma sincrona (agent.invoke en un hilo) y LangChain no
+# puede ejecutar una herramienta solo-async por esa vía; weather_tool y
+# wikipedia_tool cubren esos casos
+_TOOL_NAMES = (
+    "calculator_tool",
+    "web_search_tool",
+    "wikipedia_tool",
+    "datetime_tool",
+    "unit_converter_tool",
+    "text_analyzer_tool",
+    "text_transform_tool",
+    "random_generator_tool",
+    "weather_tool",
 )
-from src.tools.weather_tool import weather_tool
+
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY)
 
 
 def get_all_tools(serpapi_key: str = None, wikipedia_lang: str = "es") -> list:
@@ -52,21 +77,12 @@ def get_all_tools(serpapi_key: str = None, wikipedia_lang: str = "es") -> list:
     Returns:
         Lista de herramientas configuradas
     """
-    # Inicializar herramientas que requieren configuracion
-    initialize_searcher(serpapi_key)
-    initialize_wikipedia(wikipedia_lang)
+    # Inicializar en segundo plano las herramientas que requieren
+    # configuracion; cada herramienta espera a su inicializacion al usarse
+    __getattr__("initialize_searcher_async")(serpapi_key)
+    __getattr__("initialize_wikipedia_async")(wikipedia_lang)
 
-    return [
-        calculator_tool,
-        web_search_tool,
-        wikipedia_tool,
-        datetime_tool,
-        unit_converter_tool,
-        text_analyzer_tool,
-        text_transform_tool,
-        random_generator_tool,
-        weather_tool,
-    ]
+    return [__getattr__(name) for name in _TOOL_NAMES]
 
 
 __all__ = [
@@ -74,6 +90,7 @@ __all__ = [
     "calculator_tool",
     "web_search_tool",
     "wikipedia_tool",
+    "wikipedia_tool_async",
     # Nuevas herramientas
     "datetime_tool",
     "unit_converter_tool",
@@ -81,10 +98,14 @@ __all__ = [
     "text_transform_tool",
     "random_generator_tool",
     "weather_tool",
+    "aweather_tool",
     # Funciones auxiliares
     "get_all_tools",
     "initialize_searcher",
+    "initialize_searcher_async",
     "initialize_wikipedia",
+    "initialize_wikipedia_async",
     "get_search_status",
     "get_wikipedia_status",
+    "get_wikipedia_langchain_tool",
 ]
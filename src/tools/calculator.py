@@ -11,14 +11,16 @@ Ejemplo de uso:
     print(result)  # 100
 """
 
+import ast
 import math
-import re
+from functools import lru_cache
+from types import CodeType, MappingProxyType
 from typing import Union
 from langchain.tools import tool
 
 
-# Funciones matemáticas permitidas para eval seguro
-ALLOWED_NAMES = {
+# Funciones matemáticas permitidas para eval seguro (solo lectura)
+ALLOWED_NAMES = MappingProxyType({
     # Constantes
     "pi": math.pi,
     "e": math.e,
@@ -39,7 +41,7 @@ ALLOWED_NAMES = {
     "floor": math.floor,
     "factorial": math.factorial,
     "gcd": math.gcd,
-    "lcm": getattr(math, 'lcm', lambda a, b: abs(a * b) // math.gcd(a, b)),
+    "lcm": math.lcm,
 
     # Trigonometría
     "sin": math.sin,
@@ -61,7 +63,62 @@ ALLOWED_NAMES = {
     # Conversiones
     "degrees": math.degrees,
     "radians": math.radians,
-}
+})
+
+# Globales de eval: sin builtins; se reutiliza el mismo dict en cada llamada
+_GLOBALS = {"__builtins__": {}}
+
+# Nodos del árbol sintáctico permitidos en una expresión
+_ALLOWED_NODES = frozenset({
+    # Estructura
+    ast.Expression, ast.Constant, ast.Name, ast.Load, ast.Call,
+    ast.Tuple, ast.List,
+    # Operaciones
+    ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare,
+    # Operadores
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.UAdd, ast.USub, ast.Not, ast.And, ast.Or,
+    ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE,
+})
+
+# Operadores comunes en español/texto -> Python
+_OPERATOR_TABLE = str.maketrans({
+    "^": "**",  # Potencia
+    "×": "*",   # Multiplicación
+    "÷": "/",   # División
+    ",": ".",   # Decimales
+})
+
+
+def _validate(tree: ast.AST) -> None:
+    """
+    Verifica que el árbol sintáctico solo use operaciones permitidas.
+
+    Raises:
+        ValueError: Si hay nodos fuera de _ALLOWED_NODES o nombres
+                    fuera de ALLOWED_NAMES
+    """
+    for node in ast.walk(tree):
+        if type(node) not in _ALLOWED_NODES:
+            raise ValueError(f"Expresión no permitida: contiene '{type(node).__name__}'")
+        if isinstance(node, ast.Name) and node.id not in ALLOWED_NAMES:
+            raise ValueError(f"Nombre no permitido: '{node.id}'")
+        if isinstance(node, ast.Call) and not isinstance(node.func, ast.Name):
+            raise ValueError("Solo se permiten llamadas a funciones matemáticas")
+
+
+@lru_cache(maxsize=256)
+def _compile(expression: str) -> CodeType:
+    """
+    Parsea, valida y compila una expresión (cacheado por expresión).
+
+    Raises:
+        ValueError: Si la expresión usa operaciones no permitidas
+        SyntaxError: Si la expresión tiene sintaxis inválida
+    """
+    tree = ast.parse(expression, mode="eval")
+    _validate(tree)
+    return compile(tree, "<calc>", "eval")
 
 
 def safe_eval(expression: str) -> Union[int, float]:
@@ -92,39 +149,25 @@ def safe_eval(expression: str) -> Union[int, float]:
     # Limpiar la expresión
     expression = expression.strip()
 
-    # Verificar caracteres peligrosos
-    dangerous_patterns = [
-        r'__',           # Dunder methods
-        r'import',       # Import statements
-        r'exec',         # Exec function
-        r'eval',         # Eval function
-        r'open',         # File operations
-        r'os\.',         # OS module
-        r'sys\.',        # Sys module
-        r'subprocess',   # Subprocess module
-        r'\bclass\b',    # Class definitions
-        r'\bdef\b',      # Function definitions
-        r'\blambda\b',   # Lambda functions
-    ]
-
-    for pattern in dangerous_patterns:
-        if re.search(pattern, expression, re.IGNORECASE):
-            raise ValueError(f"Expresión no permitida: contiene '{pattern}'")
-
     # Reemplazar operadores comunes en español/texto
-    expression = expression.replace('^', '**')  # Potencia
-    expression = expression.replace('×', '*')   # Multiplicación
-    expression = expression.replace('÷', '/')   # División
-    expression = expression.replace(',', '.')   # Decimales
+    expression = expression.translate(_OPERATOR_TABLE)
+
+    code = _compile(expression)
 
     try:
         # Evaluar con namespace restringido
-        result = eval(expression, {"__builtins__": {}}, ALLOWED_NAMES)
+        result = eval(code, _GLOBALS, ALLOWED_NAMES)
         return result
     except Exception as e:
         raise ValueError(f"Error al evaluar '{expression}': {str(e)}")
 
 
+@lru_cache(maxsize=512)
+def _cached_safe_eval(expression: str) -> Union[int, float]:
+    """safe_eval memoizado: el agente suele repetir la misma expresión."""
+    return safe_eval(expression)
+
+
 @tool
 def calculator_tool(expression: str) -> str:
     """
@@ -147,7 +190,7 @@ def calculator_tool(expression: str) -> str:
         - "2 ** 10" → "1024"
     """
     try:
-        result = safe_eval(expression)
+        result = _cached_safe_eval(expression)
 
         # Formatear resultado
         if isinstance(result, float):
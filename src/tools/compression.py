@@ -0,0 +1,47 @@
+"""
+Compresión de textos guardados en cache.
+
+Comprime con zstd (nivel 3) si zstandard está instalado; si no, los
+textos se guardan tal cual. Lo usan el cache de Wikipedia y el cache
+semántico.
+
+Ejemplo de uso:
+    from src.tools.compression import pack, unpack
+
+    blob = pack("Albert Einstein fue un físico alemán...")
+    print(unpack(blob))
+"""
+
+import threading
+from typing import Optional, Union
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Compresor/descompresor zstd por hilo (las instancias no son thread-safe)
+_zstd_local = threading.local()
+
+
+def pack(text: str) -> Union[bytes, str]:
+    """Comprime un texto con zstd (nivel 3); sin zstandard lo deja igual."""
+    if not ZSTD_AVAILABLE:
+        return text
+    compressor = getattr(_zstd_local, "compressor", None)
+    if compressor is None:
+        compressor = _zstd_local.compressor = zstandard.ZstdCompressor(level=3)
+    return compressor.compress(text.encode("utf-8"))
+
+
+def unpack(value: Union[bytes, str]) -> Optional[str]:
+    """Inversa de pack (None si está comprimido y falta zstandard)."""
+    if isinstance(value, str):
+        return value
+    if not ZSTD_AVAILABLE:
+        return None
+    decompressor = getattr(_zstd_local, "decompressor", None)
+    if decompressor is None:
+        decompressor = _zstd_local.decompressor = zstandard.ZstdDecompressor()
+    return decompressor.decompress(value).decode("utf-8")
@@ -17,6 +17,20 @@ from langchain.tools import tool
 import re
 
 
+# Nombres en español (indexados por weekday() y month - 1)
+_DIAS_SEMANA = ("Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo")
+_MESES = ("enero", "febrero", "marzo", "abril", "mayo", "junio",
+          "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre")
+# Pares (dia, mes) precalculados: _LABELS[weekday][month - 1]
+_LABELS = tuple(tuple((dia, mes) for mes in _MESES) for dia in _DIAS_SEMANA)
+
+
+def _format_date(dt: datetime) -> str:
+    """Formatea una fecha como "Lunes, 9 de diciembre de 2024"."""
+    dia, mes = _LABELS[dt.weekday()][dt.month - 1]
+    return f"{dia}, {dt.day} de {mes} de {dt.year}"
+
+
 def parse_date(date_str: str) -> datetime:
     """
     Parsea una fecha en varios formatos comunes.
@@ -45,6 +59,93 @@ def parse_date(date_str: str) -> datetime:
     raise ValueError(f"No se pudo parsear la fecha: {date_str}")
 
 
+# Patrones compilados una sola vez
+_EN_DIAS = re.compile(r'en (\d+) días?')
+_HACE_DIAS = re.compile(r'hace (\d+) días?')
+_YEAR = re.compile(r'(\d{4})')
+_BISIESTO = re.compile(r'bisiesto')
+_SEMANA = re.compile(r'(?=.*semana)(?=.*(?:número|actual))', re.DOTALL)
+
+
+def _handle_today(now: datetime, match) -> str:
+    """Fecha actual."""
+    return _format_date(now)
+
+
+def _handle_time(now: datetime, match) -> str:
+    """Hora actual."""
+    return f"{now.strftime('%H:%M:%S')} (hora local)"
+
+
+def _handle_datetime(now: datetime, match) -> str:
+    """Fecha y hora completa."""
+    return f"{_format_date(now)} - {now.strftime('%H:%M:%S')}"
+
+
+def _handle_in_days(now: datetime, match) -> str:
+    """Calcular fecha futura: "en X días"."""
+    days = int(match.group(1))
+    future_date = now + timedelta(days=days)
+    return f"En {days} días será: {_format_date(future_date)}"
+
+
+def _handle_days_ago(now: datetime, match) -> str:
+    """Calcular fecha pasada: "hace X días"."""
+    days = int(match.group(1))
+    past_date = now - timedelta(days=days)
+    return f"Hace {days} días fue: {_format_date(past_date)}"
+
+
+def _handle_end_of_year(now: datetime, match) -> str:
+    """Días hasta fin de año."""
+    days_left = (datetime(now.year, 12, 31) - now).days
+    return f"Faltan {days_left} días para el fin de año ({now.year})"
+
+
+def _handle_leap_year(now: datetime, match) -> str:
+    """Año bisiesto."""
+    year_match = _YEAR.search(match.string)
+    year = int(year_match.group(1)) if year_match else now.year
+
+    if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
+        return f"El año {year} SÍ es bisiesto (tiene 366 días)"
+    else:
+        return f"El año {year} NO es bisiesto (tiene 365 días)"
+
+
+def _handle_week(now: datetime, match) -> str:
+    """Semana del año."""
+    week_number = now.isocalendar()[1]
+    return f"Estamos en la semana número {week_number} del año {now.year}"
+
+
+def _handle_timestamp(now: datetime, match) -> str:
+    """Timestamp actual."""
+    return f"Timestamp Unix actual: {int(now.timestamp())}"
+
+
+def _handle_day_of_year(now: datetime, match) -> str:
+    """Día del año."""
+    day_of_year = now.timetuple().tm_yday
+    return f"Hoy es el día número {day_of_year} del año {now.year}"
+
+
+# Tabla de despacho, en orden de prioridad: cada entrada es una tupla de
+# términos (basta con que aparezca uno) o un patrón compilado, y su handler
+_DISPATCH = (
+    (("fecha actual", "hoy", "fecha de hoy", "qué fecha es"), _handle_today),
+    (("hora actual", "qué hora es", "hora"), _handle_time),
+    (("fecha y hora", "ahora", "momento actual"), _handle_datetime),
+    (_EN_DIAS, _handle_in_days),
+    (_HACE_DIAS, _handle_days_ago),
+    (("fin de año", "año nuevo", "31 de diciembre"), _handle_end_of_year),
+    (_BISIESTO, _handle_leap_year),
+    (_SEMANA, _handle_week),
+    (("timestamp", "unix"), _handle_timestamp),
+    (("día del año",), _handle_day_of_year),
+)
+
+
 @tool
 def datetime_tool(query: str) -> str:
     """
@@ -71,93 +172,14 @@ def datetime_tool(query: str) -> str:
     """
     query_lower = query.lower().strip()
     now = datetime.now()
-    
-    # Fecha actual
-    if any(term in query_lower for term in ["fecha actual", "hoy", "fecha de hoy", "qué fecha es"]):
-        dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-        meses = ["enero", "febrero", "marzo", "abril", "mayo", "junio", 
-                 "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
-        
-        dia_semana = dias_semana[now.weekday()]
-        mes = meses[now.month - 1]
-        
-        return f"{dia_semana}, {now.day} de {mes} de {now.year}"
-    
-    # Hora actual
-    if any(term in query_lower for term in ["hora actual", "qué hora es", "hora"]):
-        return f"{now.strftime('%H:%M:%S')} (hora local)"
-    
-    # Fecha y hora completa
-    if any(term in query_lower for term in ["fecha y hora", "ahora", "momento actual"]):
-        dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-        meses = ["enero", "febrero", "marzo", "abril", "mayo", "junio", 
-                 "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
-        
-        dia_semana = dias_semana[now.weekday()]
-        mes = meses[now.month - 1]
-        
-        return f"{dia_semana}, {now.day} de {mes} de {now.year} - {now.strftime('%H:%M:%S')}"
-    
-    # Calcular fecha futura: "en X días"
-    match = re.search(r'en (\d+) días?', query_lower)
-    if match:
-        days = int(match.group(1))
-        future_date = now + timedelta(days=days)
-        dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-        meses = ["enero", "febrero", "marzo", "abril", "mayo", "junio", 
-                 "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
-        
-        dia_semana = dias_semana[future_date.weekday()]
-        mes = meses[future_date.month - 1]
-        
-        return f"En {days} días será: {dia_semana}, {future_date.day} de {mes} de {future_date.year}"
-    
-    # Calcular fecha pasada: "hace X días"
-    match = re.search(r'hace (\d+) días?', query_lower)
-    if match:
-        days = int(match.group(1))
-        past_date = now - timedelta(days=days)
-        dias_semana = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
-        meses = ["enero", "febrero", "marzo", "abril", "mayo", "junio", 
-                 "julio", "agosto", "septiembre", "octubre", "noviembre", "diciembre"]
-        
-        dia_semana = dias_semana[past_date.weekday()]
-        mes = meses[past_date.month - 1]
-        
-        return f"Hace {days} días fue: {dia_semana}, {past_date.day} de {mes} de {past_date.year}"
-    
-    # Días hasta fin de año
-    if any(term in query_lower for term in ["fin de año", "año nuevo", "31 de diciembre"]):
-        end_of_year = datetime(now.year, 12, 31)
-        days_left = (end_of_year - now).days
-        return f"Faltan {days_left} días para el fin de año ({now.year})"
-    
-    # Año bisiesto
-    if "bisiesto" in query_lower:
-        match = re.search(r'(\d{4})', query)
-        year = int(match.group(1)) if match else now.year
-        
-        is_leap = (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
-        
-        if is_leap:
-            return f"El año {year} SÍ es bisiesto (tiene 366 días)"
-        else:
-            return f"El año {year} NO es bisiesto (tiene 365 días)"
-    
-    # Semana del año
-    if "semana" in query_lower and ("número" in query_lower or "actual" in query_lower):
-        week_number = now.isocalendar()[1]
-        return f"Estamos en la semana número {week_number} del año {now.year}"
-    
-    # Timestamp actual
-    if "timestamp" in query_lower or "unix" in query_lower:
-        return f"Timestamp Unix actual: {int(now.timestamp())}"
-    
-    # Día del año
-    if "día del año" in query_lower:
-        day_of_year = now.timetuple().tm_yday
-        return f"Hoy es el día número {day_of_year} del año {now.year}"
-    
+
+    for matcher, handler in _DISPATCH:
+        if isinstance(matcher, re.Pattern):
+            if (match := matcher.search(query_lower)):
+                return handler(now, match)
+        elif any(term in query_lower for term in matcher):
+            return handler(now, None)
+
     # Respuesta por defecto
     return f"Fecha actual: {now.strftime('%Y-%m-%d')} | Hora: {now.strftime('%H:%M:%S')}"
 
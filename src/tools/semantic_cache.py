@@ -0,0 +1,205 @@
+"""
+Cache semántico persistente para consultas en lenguaje natural.
+
+Guarda pares (consulta, respuesta) en SQLite junto con el embedding de la
+consulta. Una consulta nueva reutiliza la respuesta de otra ya vista si
+sus embeddings son lo bastante parecidos (similitud coseno), así las
+paráfrasis ("biografía de Einstein" / "vida de Albert Einstein") no
+repiten la petición HTTP.
+
+Requiere numpy y sentence-transformers (opcionales); si no están
+instalados, open_semantic_cache() devuelve None. Las respuestas se
+guardan comprimidas con zstd si zstandard está instalado.
+
+Ejemplo de uso:
+    from src.tools.semantic_cache import open_semantic_cache
+
+    cache = open_semantic_cache("wikipedia")
+    if cache is not None:
+        cache.put("Albert Einstein", "Físico alemán...")
+        print(cache.get("biografía de albert einstein"))
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+from src.tools.compression import pack, unpack
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_THRESHOLD = 0.92
+DEFAULT_TTL = 7 * 24 * 3600  # 7 días
+DEFAULT_MAX_ROWS = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    query TEXT NOT NULL,
+    embedding BLOB NOT NULL,
+    response BLOB NOT NULL,
+    ts REAL NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+class SemanticCache:
+    """
+    Cache de respuestas indexado por similitud de embeddings.
+
+    Los embeddings se mantienen en memoria como una matriz float32
+    normalizada; cada búsqueda es un producto matriz-vector.
+
+    Attributes:
+        threshold: Similitud coseno mínima para considerar un acierto
+        ttl: Segundos que una entrada sigue siendo válida
+        max_rows: Máximo de entradas (se descartan las menos usadas)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        threshold: float = DEFAULT_THRESHOLD,
+        ttl: float = DEFAULT_TTL,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        model_name: str = DEFAULT_MODEL,
+    ):
+        """
+        Abre (o crea) el cache en disco y carga el modelo de embeddings.
+
+        Args:
+            path: Archivo SQLite
+            threshold: Similitud coseno mínima para un acierto
+            ttl: Vida de cada entrada en segundos
+            max_rows: Máximo de entradas guardadas
+            model_name: Modelo de sentence-transformers
+        """
+        import numpy as np
+        from sentence_transformers import SentenceTransformer
+
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_rows = max_rows
+
+        self._lock = threading.Lock()
+        self._last_embedding = (None, None)
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._db.execute("DELETE FROM entries WHERE ts < ?", (time.time() - ttl,))
+        self._db.commit()
+        self._reload()
+
+    def _reload(self) -> None:
+        """Carga los ids y embeddings guardados en memoria."""
+        np = self._np
+        rows = self._db.execute("SELECT id, embedding FROM entries ORDER BY id").fetchall()
+        self._ids = [row[0] for row in rows]
+        if rows:
+            self._matrix = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+        else:
+            self._matrix = None
+
+    def _embed(self, text: str):
+        """Embedding normalizado de un texto (se recuerda el último calculado)."""
+        if self._last_embedding[0] == text:
+            return self._last_embedding[1]
+        vector = self._model.encode(text, normalize_embeddings=True).astype(self._np.float32)
+        self._last_embedding = (text, vector)
+        return vector
+
+    def get(self, query: str) -> Optional[str]:
+        """
+        Busca una respuesta guardada para una consulta parecida.
+
+        Args:
+            query: La consulta
+
+        Returns:
+            La respuesta guardada, o None si no hay ninguna suficientemente parecida
+        """
+        with self._lock:
+            if self._matrix is None:
+                return None
+            similarities = self._matrix @ self._embed(query)
+            best = int(similarities.argmax())
+            if similarities[best] < self.threshold:
+                return None
+
+            entry_id = self._ids[best]
+            row = self._db.execute(
+                "SELECT response, ts FROM entries WHERE id = ?", (entry_id,)
+            ).fetchone()
+            now = time.time()
+            if row is None or now - row[1] > self.ttl:
+                return None
+            response = unpack(row[0])
+            if response is None:
+                return None
+            self._db.execute("UPDATE entries SET last_used = ? WHERE id = ?", (now, entry_id))
+            self._db.commit()
+            return response
+
+    def put(self, query: str, response: str) -> None:
+        """
+        Guarda la respuesta de una consulta.
+
+        Args:
+            query: La consulta
+            response: La respuesta a reutilizar para consultas parecidas
+        """
+        np = self._np
+        with self._lock:
+            vector = self._embed(query)
+            now = time.time()
+            cursor = self._db.execute(
+                "INSERT INTO entries (query, embedding, response, ts, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (query, vector.tobytes(), pack(response), now, now),
+            )
+            self._db.commit()
+            self._ids.append(cursor.lastrowid)
+            if self._matrix is None:
+                self._matrix = vector[np.newaxis, :]
+            else:
+                self._matrix = np.vstack([self._matrix, vector])
+
+            # Al superar el límite, conservar el 90% más usado recientemente
+            if len(self._ids) > self.max_rows:
+                keep = int(self.max_rows * 0.9)
+                self._db.execute(
+                    "DELETE FROM entries WHERE id NOT IN "
+                    "(SELECT id FROM entries ORDER BY last_used DESC LIMIT ?)",
+                    (keep,),
+                )
+                self._db.commit()
+                self._reload()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+def open_semantic_cache(name: str, **kwargs) -> Optional[SemanticCache]:
+    """
+    Abre el cache semántico `name` en el directorio de cache del usuario.
+
+    Args:
+        name: Nombre del cache (se usa como nombre de archivo)
+        **kwargs: Parámetros de SemanticCache
+
+    Returns:
+        El cache, o None si faltan numpy/sentence-transformers o no se puede abrir
+    """
+    cache_dir = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "papuproject"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return SemanticCache(cache_dir / f"{name}_semantic.sqlite3", **kwargs)
+    except ImportError:
+        return None
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error abriendo el cache semántico: {e}")
+        return None
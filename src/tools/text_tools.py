@@ -14,11 +14,27 @@ Ejemplo de uso:
     print(result)
 """
 
+import random
 import re
+import secrets
+import string
+import uuid as uuid_module
 from collections import Counter
+from operator import itemgetter
 from langchain.tools import tool
 
 
+# Palabras: lo mismo que text.split(), pero en una sola pasada del regex
+_WORD_PATTERN = re.compile(r"\S+")
+# Puntuación que se quita de cada palabra para contar frecuencias
+_WORD_PUNCTUATION = '.,!?;:()[]"\''
+# Separador aproximado de oraciones
+_SENTENCE_SPLIT = re.compile(r"[.!?]+")
+# Textos cortos (o sin espacios): se evita el most_common(5) del Counter
+_SHORT_TEXT_CHARS = 64
+_WHITESPACE = re.compile(r"\s")
+
+
 @tool
 def text_analyzer_tool(text: str) -> str:
     """
@@ -43,32 +59,36 @@ def text_analyzer_tool(text: str) -> str:
     
     # Estadísticas básicas
     char_count = len(text)
-    char_no_spaces = len(text.replace(" ", ""))
-    
-    # Palabras
-    words = text.split()
-    word_count = len(words)
+    char_no_spaces = char_count - text.count(" ")
+    
+    # Palabras: una sola pasada acumula conteo, longitudes y frecuencias
+    word_freq = Counter()
+    word_count = 0
+    total_length = 0
+    longest_word = ""
+    for match in _WORD_PATTERN.finditer(text):
+        word = match.group()
+        length = len(word)
+        word_count += 1
+        total_length += length
+        if length > len(longest_word):
+            longest_word = word
+        word_freq[word.lower().strip(_WORD_PUNCTUATION)] += 1
     
     # Oraciones (aproximado)
-    sentences = re.split(r'[.!?]+', text)
-    sentences = [s.strip() for s in sentences if s.strip()]
-    sentence_count = len(sentences)
+    sentence_count = sum(1 for s in _SENTENCE_SPLIT.split(text) if s.strip())
     
     # Párrafos
-    paragraphs = text.split('\n\n')
-    paragraphs = [p.strip() for p in paragraphs if p.strip()]
-    paragraph_count = len(paragraphs)
-    
-    # Palabra más larga
-    longest_word = max(words, key=len) if words else ""
+    paragraph_count = sum(1 for p in text.split('\n\n') if p.strip())
     
     # Longitud promedio de palabra
-    avg_word_length = sum(len(w) for w in words) / word_count if word_count > 0 else 0
+    avg_word_length = total_length / word_count if word_count > 0 else 0
     
-    # Palabras más frecuentes
-    words_lower = [w.lower().strip('.,!?;:()[]"\'') for w in words]
-    word_freq = Counter(words_lower)
-    most_common = word_freq.most_common(5)
+    # Palabras más frecuentes (en textos cortos basta ordenar las pocas que hay)
+    if char_count < _SHORT_TEXT_CHARS or not _WHITESPACE.search(text):
+        most_common = sorted(word_freq.items(), key=itemgetter(1), reverse=True)[:5]
+    else:
+        most_common = word_freq.most_common(5)
     
     result = f"""📊 ANÁLISIS DE TEXTO:
 
@@ -82,7 +102,7 @@ def text_analyzer_tool(text: str) -> str:
 📏 Métricas:
    • Longitud promedio de palabra: {avg_word_length:.1f} caracteres
    • Palabra más larga: "{longest_word}" ({len(longest_word)} caracteres)
-   • Palabras por oración: {word_count/sentence_count:.1f}
+   • Palabras por oración: {word_count / sentence_count if sentence_count else 0:.1f}
 
 🔤 Palabras más frecuentes:"""
     
@@ -91,6 +111,56 @@ def text_analyzer_tool(text: str) -> str:
     
     return result
 
+# Vocales (con y sin acento) para contar_vocales
+_VOWELS = "aeiouáéíóúAEIOUÁÉÍÓÚ"
+# Tabla para quitar_acentos
+_ACCENT_TABLE = str.maketrans({
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
+    'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U'
+})
+
+
+def _count_vowels(text: str) -> str:
+    """Cuenta las vocales (con y sin acento)."""
+    count = sum(text.count(v) for v in _VOWELS)
+    return f"El texto tiene {count} vocales"
+
+
+def _count_words(text: str) -> str:
+    """Cuenta las palabras separadas por espacios."""
+    return f"El texto tiene {len(text.split())} palabras"
+
+
+def _count_chars(text: str) -> str:
+    """Cuenta los caracteres."""
+    return f"El texto tiene {len(text)} caracteres"
+
+
+def _initials(text: str) -> str:
+    """Obtiene las iniciales de cada palabra."""
+    initials = "".join(w[0].upper() for w in text.split() if w)
+    return f"Iniciales: {initials}"
+
+
+# Operaciones de text_transform_tool: alias -> función
+_TRANSFORM_OPS = {}
+for _aliases, _transform in [
+    (("mayusculas", "mayúsculas", "uppercase", "upper"), str.upper),
+    (("minusculas", "minúsculas", "lowercase", "lower"), str.lower),
+    (("titulo", "título", "title", "capitalize"), str.title),
+    (("invertir", "reverse", "reverso"), lambda text: text[::-1]),
+    (("quitar_espacios", "trim", "strip"), lambda text: " ".join(text.split())),
+    (("contar_vocales", "vocales", "vowels"), _count_vowels),
+    (("quitar_acentos", "sin_acentos", "remove_accents"), lambda text: text.translate(_ACCENT_TABLE)),
+    (("palabras", "word_count", "contar_palabras"), _count_words),
+    (("caracteres", "char_count", "contar_caracteres"), _count_chars),
+    (("primera_letra", "initials", "iniciales"), _initials),
+]:
+    for _alias in _aliases:
+        _TRANSFORM_OPS[_alias] = _transform
+del _aliases, _transform, _alias
+
 
 @tool
 def text_transform_tool(query: str) -> str:
@@ -136,51 +206,10 @@ Operaciones disponibles:
         return "Error: No se proporcionó texto para transformar."
     
     # Operaciones de transformación
-    if operation in ["mayusculas", "mayúsculas", "uppercase", "upper"]:
-        return text.upper()
-    
-    elif operation in ["minusculas", "minúsculas", "lowercase", "lower"]:
-        return text.lower()
-    
-    elif operation in ["titulo", "título", "title", "capitalize"]:
-        return text.title()
-    
-    elif operation in ["invertir", "reverse", "reverso"]:
-        return text[::-1]
-    
-    elif operation in ["quitar_espacios", "trim", "strip"]:
-        return " ".join(text.split())
-    
-    elif operation in ["contar_vocales", "vocales", "vowels"]:
-        vocales = "aeiouáéíóúAEIOUÁÉÍÓÚ"
-        count = sum(1 for c in text if c in vocales)
-        return f"El texto tiene {count} vocales"
-    
-    elif operation in ["quitar_acentos", "sin_acentos", "remove_accents"]:
-        accent_map = {
-            'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-            'Á': 'A', 'É': 'E', 'Í': 'I', 'Ó': 'O', 'Ú': 'U',
-            'ñ': 'n', 'Ñ': 'N', 'ü': 'u', 'Ü': 'U'
-        }
-        result = ""
-        for char in text:
-            result += accent_map.get(char, char)
-        return result
-    
-    elif operation in ["palabras", "word_count", "contar_palabras"]:
-        words = text.split()
-        return f"El texto tiene {len(words)} palabras"
-    
-    elif operation in ["caracteres", "char_count", "contar_caracteres"]:
-        return f"El texto tiene {len(text)} caracteres"
-    
-    elif operation in ["primera_letra", "initials", "iniciales"]:
-        words = text.split()
-        initials = "".join(w[0].upper() for w in words if w)
-        return f"Iniciales: {initials}"
-    
-    else:
-        return f"""Operación no reconocida: "{operation}"
+    transform = _TRANSFORM_OPS.get(operation)
+    if transform is not None:
+        return transform(text)
+    return f"""Operación no reconocida: "{operation}"
         
 Operaciones disponibles:
 - mayusculas, minusculas, titulo
@@ -189,6 +218,22 @@ Operaciones disponibles:
 - quitar_acentos, primera_letra (iniciales)"""
 
 
+# Patrones y alfabeto de random_generator_tool
+_NUMERO_PATTERN = re.compile(r'n[úu]mero\s+entre\s+(\d+)\s+y\s+(\d+)')
+_PASSWORD_LENGTH_PATTERN = re.compile(r'contrase[ñn]a\s+(?:de\s+)?(\d+)')
+_DICE_PATTERN = re.compile(r'd(\d+)')
+_PASSWORD_CHARS = string.ascii_letters + string.digits + "!@#$%^&*"
+
+
+def _generate_password(length: int) -> str:
+    """Genera una contraseña de entre 8 y 64 caracteres."""
+    length = max(8, min(length, 64))  # Entre 8 y 64 caracteres
+
+    # secrets (os.urandom) en lugar de random: es una contraseña real
+    password = ''.join(secrets.choice(_PASSWORD_CHARS) for _ in range(length))
+    return f"Contraseña generada ({length} caracteres): {password}"
+
+
 @tool
 def random_generator_tool(query: str) -> str:
     """
@@ -211,29 +256,20 @@ def random_generator_tool(query: str) -> str:
     Returns:
         El valor generado aleatoriamente.
     """
-    import random
-    import string
-    import uuid as uuid_module
-    
     query_lower = query.lower().strip()
     
     # Número aleatorio en rango
-    match = re.search(r'n[úu]mero\s+entre\s+(\d+)\s+y\s+(\d+)', query_lower)
-    if match:
+    if (match := _NUMERO_PATTERN.search(query_lower)):
         min_val = int(match.group(1))
         max_val = int(match.group(2))
         result = random.randint(min(min_val, max_val), max(min_val, max_val))
         return f"Número aleatorio entre {min_val} y {max_val}: {result}"
     
     # Contraseña
-    match = re.search(r'contrase[ñn]a\s+(?:de\s+)?(\d+)', query_lower)
-    if match or "contraseña" in query_lower or "password" in query_lower:
-        length = int(match.group(1)) if match else 12
-        length = max(8, min(length, 64))  # Entre 8 y 64 caracteres
-        
-        chars = string.ascii_letters + string.digits + "!@#$%^&*"
-        password = ''.join(random.choice(chars) for _ in range(length))
-        return f"Contraseña generada ({length} caracteres): {password}"
+    if (match := _PASSWORD_LENGTH_PATTERN.search(query_lower)):
+        return _generate_password(int(match.group(1)))
+    elif "contraseña" in query_lower or "password" in query_lower:
+        return _generate_password(12)
     
     # UUID
     if "uuid" in query_lower:
@@ -251,7 +287,7 @@ def random_generator_tool(query: str) -> str:
     
     # Dado
     if "dado" in query_lower or "dice" in query_lower:
-        match = re.search(r'd(\d+)', query_lower)
+        match = _DICE_PATTERN.search(query_lower)
         sides = int(match.group(1)) if match else 6
         result = random.randint(1, sides)
         return f"🎲 Resultado del dado (d{sides}): {result}"
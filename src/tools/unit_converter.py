@@ -11,11 +11,32 @@ Ejemplo de uso:
     print(result)
 """
 
+import importlib.util
 import re
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Final, Tuple, Optional
 from langchain.tools import tool
 
 
+# numpy y numba son opcionales (extra "array") y solo los usa
+# convert_units_array; se importan en su primera llamada, no al cargar el módulo
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _affine(values, scale, offset):
+    """Aplica values * scale + offset (kernel de convert_units_array)."""
+    return values * scale + offset
+
+
+@lru_cache(maxsize=1)
+def _get_affine():
+    """Kernel de convert_units_array, compilado con numba si está instalado."""
+    if not NUMBA_AVAILABLE:
+        return _affine
+    from numba import njit
+    return njit(cache=True)(_affine)
+
+
 # Factores de conversión (todo a unidad base)
 CONVERSIONS = {
     # Longitud (base: metros)
@@ -155,6 +176,26 @@ CONVERSIONS = {
 }
 
 
+# Índice plano: unidad -> (categoría, factor a la unidad base)
+_UNIT_INDEX = {
+    unit: (category, factor)
+    for category, data in CONVERSIONS.items()
+    for unit, factor in data["unidades"].items()
+}
+
+# Patrones de conversión reconocidos por unit_converter_tool
+_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+\.?\d*)\s*(\S+)\s+(?:a|to|en|=)\s+(\S+)',
+    r'convertir\s+(\d+\.?\d*)\s*(\S+)\s+a\s+(\S+)',
+    r'cuánto[s]?\s+(?:es|son)\s+(\d+\.?\d*)\s*(\S+)\s+en\s+(\S+)',
+))
+
+
+def _normalize_unit(unit: str) -> str:
+    """Forma canónica de una unidad: sin espacios extremos y en minúsculas."""
+    return unit.strip().casefold()
+
+
 def find_unit_category(unit: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Encuentra la categoría a la que pertenece una unidad.
@@ -165,48 +206,74 @@ def find_unit_category(unit: str) -> Tuple[Optional[str], Optional[str]]:
     Returns:
         Tupla (categoría, unidad_normalizada) o (None, None)
     """
-    unit_lower = unit.lower().strip()
-    
-    for category, data in CONVERSIONS.items():
-        if unit_lower in data["unidades"]:
-            return category, unit_lower
-    
-    return None, None
+    unit_lower = _normalize_unit(unit)
+    entry = _UNIT_INDEX.get(unit_lower)
+    if entry is None:
+        return None, None
+    return entry[0], unit_lower
 
 
-def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
+@lru_cache(maxsize=256)
+def _pair_factor(from_unit: str, to_unit: str) -> float:
     """
-    Convierte temperaturas (caso especial, no es multiplicativo).
+    Factor directo de from_unit a to_unit (unidades ya normalizadas).
+
+    Raises:
+        ValueError: si alguna unidad no existe o son de categorías distintas
     """
-    from_unit = from_unit.lower()
-    to_unit = to_unit.lower()
-    
-    # Normalizar nombres
-    from_map = {"c": "c", "celsius": "c", "°c": "c", "f": "f", "fahrenheit": "f", "°f": "f", "k": "k", "kelvin": "k"}
-    to_map = from_map
-    
-    from_unit = from_map.get(from_unit, from_unit)
-    to_unit = to_map.get(to_unit, to_unit)
-    
-    # Convertir a Celsius primero
-    if from_unit == "c":
-        celsius = value
-    elif from_unit == "f":
-        celsius = (value - 32) * 5/9
-    elif from_unit == "k":
-        celsius = value - 273.15
-    else:
+    try:
+        from_cat, from_factor = _UNIT_INDEX[from_unit]
+    except KeyError:
+        raise ValueError(f"Unidad no reconocida: {from_unit}") from None
+    try:
+        to_cat, to_factor = _UNIT_INDEX[to_unit]
+    except KeyError:
+        raise ValueError(f"Unidad no reconocida: {to_unit}") from None
+    if from_cat != to_cat:
+        raise ValueError(f"No se puede convertir {from_unit} ({from_cat}) a {to_unit} ({to_cat})")
+    return from_factor / to_factor
+
+
+# Alias de unidades de temperatura -> clave normalizada
+_TEMP_ALIAS = {
+    "c": "c", "celsius": "c", "°c": "c",
+    "f": "f", "fahrenheit": "f", "°f": "f",
+    "k": "k", "kelvin": "k",
+}
+
+# Unidades que se tratan como temperatura
+_TEMP_UNITS: Final[frozenset] = frozenset(_TEMP_ALIAS)
+
+# Conversiones de temperatura por par (origen, destino)
+_TEMP_CONVERT = {
+    ("c", "c"): lambda v: v,
+    ("c", "f"): lambda v: v * 9/5 + 32,
+    ("c", "k"): lambda v: v + 273.15,
+    ("f", "c"): lambda v: (v - 32) * 5/9,
+    ("f", "f"): lambda v: v,
+    ("f", "k"): lambda v: (v - 32) * 5/9 + 273.15,
+    ("k", "c"): lambda v: v - 273.15,
+    ("k", "f"): lambda v: (v - 273.15) * 9/5 + 32,
+    ("k", "k"): lambda v: v,
+}
+
+
+def _temperature_converter(from_unit: str, to_unit: str):
+    """Función de conversión para dos unidades de temperatura ya normalizadas."""
+    from_key = _TEMP_ALIAS.get(from_unit)
+    if from_key is None:
         raise ValueError(f"Unidad de temperatura no reconocida: {from_unit}")
-    
-    # Convertir de Celsius a destino
-    if to_unit == "c":
-        return celsius
-    elif to_unit == "f":
-        return celsius * 9/5 + 32
-    elif to_unit == "k":
-        return celsius + 273.15
-    else:
+    to_key = _TEMP_ALIAS.get(to_unit)
+    if to_key is None:
         raise ValueError(f"Unidad de temperatura no reconocida: {to_unit}")
+    return _TEMP_CONVERT[from_key, to_key]
+
+
+def convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
+    """
+    Convierte temperaturas (caso especial, no es multiplicativo).
+    """
+    return _temperature_converter(_normalize_unit(from_unit), _normalize_unit(to_unit))(value)
 
 
 def convert_units(value: float, from_unit: str, to_unit: str) -> Tuple[float, str]:
@@ -216,75 +283,63 @@ def convert_units(value: float, from_unit: str, to_unit: str) -> Tuple[float, st
     Returns:
         Tupla (valor_convertido, mensaje)
     """
-    from_unit_lower = from_unit.lower().strip()
-    to_unit_lower = to_unit.lower().strip()
+    from_unit_lower = _normalize_unit(from_unit)
+    to_unit_lower = _normalize_unit(to_unit)
     
     # Manejar temperatura por separado
-    temp_units = ["c", "celsius", "°c", "f", "fahrenheit", "°f", "k", "kelvin"]
-    if from_unit_lower in temp_units or to_unit_lower in temp_units:
-        result = convert_temperature(value, from_unit_lower, to_unit_lower)
+    if from_unit_lower in _TEMP_UNITS or to_unit_lower in _TEMP_UNITS:
+        result = _temperature_converter(from_unit_lower, to_unit_lower)(value)
         return result, f"{value} {from_unit} = {result:.2f} {to_unit}"
     
-    # Encontrar categorías
-    from_cat, from_normalized = find_unit_category(from_unit_lower)
-    to_cat, to_normalized = find_unit_category(to_unit_lower)
-    
-    if from_cat is None:
-        raise ValueError(f"Unidad no reconocida: {from_unit}")
-    if to_cat is None:
-        raise ValueError(f"Unidad no reconocida: {to_unit}")
-    if from_cat != to_cat:
-        raise ValueError(f"No se puede convertir {from_unit} ({from_cat}) a {to_unit} ({to_cat})")
-    
-    # Obtener factores
-    from_factor = CONVERSIONS[from_cat]["unidades"][from_normalized]
-    to_factor = CONVERSIONS[from_cat]["unidades"][to_normalized]
-    
-    # Convertir: valor -> base -> destino
-    base_value = value * from_factor
-    result = base_value / to_factor
+    # Convertir con el factor directo origen -> destino
+    result = value * _pair_factor(from_unit_lower, to_unit_lower)
     
     return result, f"{value} {from_unit} = {result:.6g} {to_unit}"
 
 
-@tool
-def unit_converter_tool(query: str) -> str:
+def convert_units_array(values, from_unit: str, to_unit: str):
     """
-    Convierte entre diferentes unidades de medida.
+    Convierte un array de valores de una unidad a otra.
     
-    Soporta conversiones de: longitud, peso, volumen, tiempo, temperatura,
-    velocidad, área y datos/almacenamiento.
+    Pensado para lotes grandes: la unidad se resuelve una sola vez y la
+    conversión se aplica a todo el array (compilada con numba si está
+    disponible). Requiere numpy (pip install "papuproject[array]").
     
     Args:
-        query: Consulta de conversión en formato "valor unidad_origen a unidad_destino"
-               Ejemplos:
-               - "100 km a millas"
-               - "75 fahrenheit a celsius"
-               - "5 libras a kilogramos"
-               - "1024 mb a gb"
-               
-    Returns:
-        El resultado de la conversión.
+        values: Secuencia o array de valores numéricos
+        from_unit: Unidad de origen
+        to_unit: Unidad de destino
         
-    Examples:
-        - "100 km a millas" → "100 km = 62.1371 millas"
-        - "32 fahrenheit a celsius" → "32 fahrenheit = 0.00 celsius"
-        - "1 hora a minutos" → "1 hora = 60 minutos"
+    Returns:
+        numpy.ndarray de float64 con los valores convertidos
     """
-    query = query.strip()
+    import numpy as np
     
-    # Patrones de conversión
-    patterns = [
-        r'(\d+\.?\d*)\s*(\S+)\s+(?:a|to|en|=)\s+(\S+)',
-        r'convertir\s+(\d+\.?\d*)\s*(\S+)\s+a\s+(\S+)',
-        r'cuánto[s]?\s+(?:es|son)\s+(\d+\.?\d*)\s*(\S+)\s+en\s+(\S+)',
-    ]
+    from_unit_lower = _normalize_unit(from_unit)
+    to_unit_lower = _normalize_unit(to_unit)
+    
+    # Temperatura: todas las conversiones son afines (v * escala + desplazamiento)
+    if from_unit_lower in _TEMP_UNITS or to_unit_lower in _TEMP_UNITS:
+        convert = _temperature_converter(from_unit_lower, to_unit_lower)
+        offset = convert(0.0)
+        scale = convert(1.0) - offset
+    else:
+        scale = _pair_factor(from_unit_lower, to_unit_lower)
+        offset = 0.0
     
-    for pattern in patterns:
-        match = re.search(pattern, query, re.IGNORECASE)
+    return _get_affine()(np.asarray(values, dtype=np.float64), scale, offset)
+
+
+def _unit_convert_impl(query: str) -> str:
+    """Implementación de unit_converter_tool (llamable sin pasar por LangChain)."""
+    query = query.strip()
+    
+    for pattern in _PATTERNS:
+        match = pattern.search(query)
         if match:
             try:
-                value = float(match.group(1))
+                raw = match.group(1)
+                value = int(raw) if "." not in raw else float(raw)
                 from_unit = match.group(2)
                 to_unit = match.group(3)
                 
@@ -308,6 +363,33 @@ Ejemplos:
 Categorías soportadas: longitud, peso, volumen, tiempo, temperatura, velocidad, área, datos"""
 
 
+@tool
+def unit_converter_tool(query: str) -> str:
+    """
+    Convierte entre diferentes unidades de medida.
+    
+    Soporta conversiones de: longitud, peso, volumen, tiempo, temperatura,
+    velocidad, área y datos/almacenamiento.
+    
+    Args:
+        query: Consulta de conversión en formato "valor unidad_origen a unidad_destino"
+               Ejemplos:
+               - "100 km a millas"
+               - "75 fahrenheit a celsius"
+               - "5 libras a kilogramos"
+               - "1024 mb a gb"
+               
+    Returns:
+        El resultado de la conversión.
+        
+    Examples:
+        - "100 km a millas" → "100 km = 62.1371 millas"
+        - "32 fahrenheit a celsius" → "32 fahrenheit = 0.00 celsius"
+        - "1 hora a minutos" → "1 hora = 60 minutos"
+    """
+    return _unit_convert_impl(query)
+
+
 # Para uso directo del módulo
 if __name__ == "__main__":
     test_queries = [
@@ -323,6 +405,6 @@ if __name__ == "__main__":
     print("-" * 50)
     
     for query in test_queries:
-        result = unit_converter_tool.invoke(query)
+        result = _unit_convert_impl(query)
         print(f"'{query}' → {result}")
         print()
@@ -11,14 +11,122 @@ Ejemplo de uso:
     print(result)
 """
 
+import asyncio
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from typing import Final, Optional, Dict, Any, List, Tuple
 from langchain.tools import tool
 import re
 
+# Cliente HTTP asíncrono opcional (aweather_tool)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
-# Cache simple para geocodificación
-_geocode_cache: Dict[str, Dict[str, Any]] = {}
+try:
+    import h2  # noqa: F401  (habilita HTTP/2 en httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+_GEOCODE_URL = "https://geocoding-api.open-meteo.com/v1/search"
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Sesión HTTP compartida: reutiliza las conexiones keep-alive con Open-Meteo
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Cache de geocodificación, persistido en disco entre ejecuciones
+_CACHE_PATH = Path(
+    os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+) / "papuproject" / "geocode.json"
+_cache_lock = threading.Lock()
+
+
+def _load_geocode_cache() -> Dict[str, Dict[str, Any]]:
+    """Lee el cache de geocodificación guardado, o devuelve uno vacío."""
+    try:
+        with open(_CACHE_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_geocode_cache() -> None:
+    """Escribe el cache de geocodificación en disco (errores ignorados)."""
+    with _cache_lock:
+        snapshot = dict(_geocode_cache or {})
+        try:
+            _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, _CACHE_PATH)
+        except OSError:
+            pass
+
+
+# Se lee de disco en el primer uso, no al importar el módulo
+_geocode_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _get_geocode_cache() -> Dict[str, Dict[str, Any]]:
+    """Devuelve el cache de geocodificación, cargándolo la primera vez."""
+    global _geocode_cache
+    if _geocode_cache is None:
+        with _cache_lock:
+            if _geocode_cache is None:
+                _geocode_cache = _load_geocode_cache()
+    return _geocode_cache
+
+# Cache de clima con expiración: (lat, lon) redondeados -> (instante, datos)
+WEATHER_CACHE_TTL = 300  # segundos
+WEATHER_CACHE_SIZE = 128
+_WX_CACHE: Dict[Tuple[float, float], Tuple[float, Dict[str, Any]]] = {}
+# weather_tool_batch llena la cache desde varios hilos
+_wx_cache_lock = threading.Lock()
+
+
+def _geocode_params(city: str) -> Dict[str, Any]:
+    """Parámetros de la Geocoding API para una ciudad."""
+    return {
+        "name": city,
+        "count": 1,
+        "language": "es",
+        "format": "json"
+    }
+
+
+def _store_location(city_lower: str, city: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Extrae la ubicación de la respuesta de geocodificación y la guarda en cache."""
+    if "results" not in data or len(data["results"]) == 0:
+        return None
+    
+    result = data["results"][0]
+    location = {
+        "lat": result["latitude"],
+        "lon": result["longitude"],
+        "name": result.get("name", city),
+        "country": result.get("country", ""),
+        "admin1": result.get("admin1", ""),  # Estado/Provincia
+    }
+    
+    # Guardar en cache y persistirlo fuera del camino de la respuesta
+    _get_geocode_cache()[city_lower] = location
+    threading.Thread(target=_save_geocode_cache, daemon=True).start()
+    
+    return location
 
 
 def geocode_city(city: str) -> Optional[Dict[str, Any]]:
@@ -34,45 +142,63 @@ def geocode_city(city: str) -> Optional[Dict[str, Any]]:
     city_lower = city.lower().strip()
     
     # Revisar cache
-    if city_lower in _geocode_cache:
-        return _geocode_cache[city_lower]
+    cached = _get_geocode_cache().get(city_lower)
+    if cached is not None:
+        return cached
     
     try:
-        url = "https://geocoding-api.open-meteo.com/v1/search"
-        params = {
-            "name": city,
-            "count": 1,
-            "language": "es",
-            "format": "json"
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(_GEOCODE_URL, params=_geocode_params(city), timeout=10)
         response.raise_for_status()
         
-        data = response.json()
-        
-        if "results" not in data or len(data["results"]) == 0:
-            return None
-        
-        result = data["results"][0]
-        location = {
-            "lat": result["latitude"],
-            "lon": result["longitude"],
-            "name": result.get("name", city),
-            "country": result.get("country", ""),
-            "admin1": result.get("admin1", ""),  # Estado/Provincia
-        }
+        return _store_location(city_lower, city, response.json())
         
-        # Guardar en cache
-        _geocode_cache[city_lower] = location
-        
-        return location
-        
-    except Exception as e:
+    except (RequestException, ValueError, KeyError) as e:
         print(f"Error en geocodificación: {e}")
         return None
 
 
+def _forecast_params(lat: float, lon: float) -> Dict[str, Any]:
+    """Parámetros de la Forecast API para unas coordenadas."""
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "current": [
+            "temperature_2m",
+            "relative_humidity_2m",
+            "apparent_temperature",
+            "weather_code",
+            "wind_speed_10m",
+            "wind_direction_10m",
+            "precipitation"
+        ],
+        "daily": [
+            "temperature_2m_max",
+            "temperature_2m_min",
+            "precipitation_probability_max",
+            "weather_code"
+        ],
+        "timezone": "auto",
+        "forecast_days": 3
+    }
+
+
+def _cached_weather(key: Tuple[float, float]) -> Optional[Dict[str, Any]]:
+    """Devuelve el clima en cache si no ha expirado."""
+    cached = _WX_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _store_weather(key: Tuple[float, float], data: Dict[str, Any]) -> None:
+    """Guarda el clima en cache, descartando la entrada más antigua si está lleno."""
+    with _wx_cache_lock:
+        _WX_CACHE.pop(key, None)
+        if len(_WX_CACHE) >= WEATHER_CACHE_SIZE:
+            _WX_CACHE.pop(next(iter(_WX_CACHE), None), None)
+        _WX_CACHE[key] = (time.monotonic(), data)
+
+
 def get_weather(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     """
     Obtiene el clima actual usando Open-Meteo API.
@@ -84,76 +210,138 @@ def get_weather(lat: float, lon: float) -> Optional[Dict[str, Any]]:
     Returns:
         Dict con información del clima o None si hay error
     """
+    # Revisar cache (el pronóstico apenas cambia en unos minutos)
+    key = (round(lat, 2), round(lon, 2))
+    cached = _cached_weather(key)
+    if cached is not None:
+        return cached
+    
     try:
-        url = "https://api.open-meteo.com/v1/forecast"
-        params = {
-            "latitude": lat,
-            "longitude": lon,
-            "current": [
-                "temperature_2m",
-                "relative_humidity_2m",
-                "apparent_temperature",
-                "weather_code",
-                "wind_speed_10m",
-                "wind_direction_10m",
-                "precipitation"
-            ],
-            "daily": [
-                "temperature_2m_max",
-                "temperature_2m_min",
-                "precipitation_probability_max",
-                "weather_code"
-            ],
-            "timezone": "auto",
-            "forecast_days": 3
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(_FORECAST_URL, params=_forecast_params(lat, lon), timeout=10)
         response.raise_for_status()
         
-        return response.json()
+        data = response.json()
+        _store_weather(key, data)
+        return data
         
-    except Exception as e:
+    except (RequestException, ValueError, KeyError) as e:
+        print(f"Error obteniendo clima: {e}")
+        return None
+
+
+async def _ageocode_city(client: "httpx.AsyncClient", city: str) -> Optional[Dict[str, Any]]:
+    """Versión asíncrona de geocode_city (comparte el cache)."""
+    city_lower = city.lower().strip()
+    cached = _get_geocode_cache().get(city_lower)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await client.get(_GEOCODE_URL, params=_geocode_params(city))
+        response.raise_for_status()
+        return _store_location(city_lower, city, response.json())
+    except (httpx.HTTPError, ValueError, KeyError) as e:
+        print(f"Error en geocodificación: {e}")
+        return None
+
+
+async def _aget_weather(client: "httpx.AsyncClient", lat: float, lon: float) -> Optional[Dict[str, Any]]:
+    """Versión asíncrona de get_weather (comparte el cache)."""
+    key = (round(lat, 2), round(lon, 2))
+    cached = _cached_weather(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        response = await client.get(_FORECAST_URL, params=_forecast_params(lat, lon))
+        response.raise_for_status()
+        data = response.json()
+        _store_weather(key, data)
+        return data
+    except (httpx.HTTPError, ValueError, KeyError) as e:
         print(f"Error obteniendo clima: {e}")
         return None
 
 
+# Códigos de clima WMO -> descripción en español
+_WEATHER_CODES: Final[Dict[int, str]] = {
+    0: "☀️ Despejado",
+    1: "🌤️ Mayormente despejado",
+    2: "⛅ Parcialmente nublado",
+    3: "☁️ Nublado",
+    45: "🌫️ Niebla",
+    48: "🌫️ Niebla con escarcha",
+    51: "🌧️ Llovizna ligera",
+    53: "🌧️ Llovizna moderada",
+    55: "🌧️ Llovizna intensa",
+    61: "🌧️ Lluvia ligera",
+    63: "🌧️ Lluvia moderada",
+    65: "🌧️ Lluvia intensa",
+    71: "🌨️ Nieve ligera",
+    73: "🌨️ Nieve moderada",
+    75: "🌨️ Nieve intensa",
+    77: "🌨️ Granizo",
+    80: "🌦️ Chubascos ligeros",
+    81: "🌦️ Chubascos moderados",
+    82: "🌦️ Chubascos intensos",
+    85: "🌨️ Chubascos de nieve ligeros",
+    86: "🌨️ Chubascos de nieve intensos",
+    95: "⛈️ Tormenta",
+    96: "⛈️ Tormenta con granizo ligero",
+    99: "⛈️ Tormenta con granizo intenso",
+}
+
+# Direcciones cardinales cada 45 grados
+_WIND_DIRS = ("N", "NE", "E", "SE", "S", "SO", "O", "NO")
+
+
 def weather_code_to_description(code: int) -> str:
     """Convierte código de clima a descripción en español."""
-    weather_codes = {
-        0: "☀️ Despejado",
-        1: "🌤️ Mayormente despejado",
-        2: "⛅ Parcialmente nublado",
-        3: "☁️ Nublado",
-        45: "🌫️ Niebla",
-        48: "🌫️ Niebla con escarcha",
-        51: "🌧️ Llovizna ligera",
-        53: "🌧️ Llovizna moderada",
-        55: "🌧️ Llovizna intensa",
-        61: "🌧️ Lluvia ligera",
-        63: "🌧️ Lluvia moderada",
-        65: "🌧️ Lluvia intensa",
-        71: "🌨️ Nieve ligera",
-        73: "🌨️ Nieve moderada",
-        75: "🌨️ Nieve intensa",
-        77: "🌨️ Granizo",
-        80: "🌦️ Chubascos ligeros",
-        81: "🌦️ Chubascos moderados",
-        82: "🌦️ Chubascos intensos",
-        85: "🌨️ Chubascos de nieve ligeros",
-        86: "🌨️ Chubascos de nieve intensos",
-        95: "⛈️ Tormenta",
-        96: "⛈️ Tormenta con granizo ligero",
-        99: "⛈️ Tormenta con granizo intenso",
-    }
-    return weather_codes.get(code, f"Código {code}")
+    return _WEATHER_CODES.get(code, f"Código {code}")
+
+
+# Extracción del nombre de la ciudad en una sola búsqueda. Cada alternativa
+# lleva su propio prefijo perezoso, así se prueba completa antes que la
+# siguiente: palabra clave + preposición, palabra clave sola, "en"/"de"
+_CITY_RE = re.compile(r'''(?ix) \A (?:
+    (?s:.*?) (?:clima|tiempo|temperatura|pronóstico|pronostico|weather) \s+ (?:en|de|para|in) \s+ (?P<ciudad>.+)
+  | (?s:.*?) (?:clima|tiempo|temperatura|pronóstico|pronostico|weather) \s+ (?P<ciudad_sin_prep>.+)
+  | (?s:.*?) (?:en|de) \s+ (?P<lugar>.+)
+)''')
 
 
 def wind_direction_to_text(degrees: float) -> str:
     """Convierte grados a dirección cardinal."""
-    directions = ["N", "NE", "E", "SE", "S", "SO", "O", "NO"]
-    index = round(degrees / 45) % 8
-    return directions[index]
+    return _WIND_DIRS[round(degrees / 45) % 8]
+
+
+def _extract_city(query: str) -> str:
+    """Extrae el nombre de la ciudad de la consulta (o la consulta completa)."""
+    match = _CITY_RE.search(query)
+    if match:
+        return match.group(match.lastgroup).strip() or query.strip()
+    return query.strip()
+
+
+def _weather_impl(query: str) -> str:
+    """Implementación de weather_tool (llamable sin pasar por LangChain)."""
+    city = _extract_city(query)
+    if not city:
+        return "Por favor especifica una ciudad. Ejemplo: 'clima en Madrid'"
+    
+    # Geocodificar
+    location = geocode_city(city)
+    
+    if not location:
+        return f"No pude encontrar la ciudad: {city}. Intenta con otro nombre o verifica la ortografía."
+    
+    # Obtener clima
+    weather_data = get_weather(location["lat"], location["lon"])
+    
+    if not weather_data:
+        return f"No pude obtener el clima para {location['name']}. Intenta de nuevo más tarde."
+    
+    return _format_weather(location, weather_data)
 
 
 @tool
@@ -178,39 +366,21 @@ def weather_tool(query: str) -> str:
         - "clima en Madrid" → Información completa del clima
         - "temperatura París" → Temperatura actual y sensación térmica
     """
-    # Extraer nombre de ciudad
-    patterns = [
-        r'(?:clima|tiempo|temperatura|pronóstico|pronostico|weather)\s+(?:en|de|para|in)\s+(.+)',
-        r'(?:clima|tiempo|temperatura|pronóstico|pronostico|weather)\s+(.+)',
-        r'(?:en|de)\s+(.+)',
-    ]
-    
-    city = None
-    for pattern in patterns:
-        match = re.search(pattern, query, re.IGNORECASE)
-        if match:
-            city = match.group(1).strip()
-            break
-    
-    if not city:
-        city = query.strip()
-    
-    if not city:
-        return "Por favor especifica una ciudad. Ejemplo: 'clima en Madrid'"
-    
-    # Geocodificar
-    location = geocode_city(city)
-    
-    if not location:
-        return f"No pude encontrar la ciudad: {city}. Intenta con otro nombre o verifica la ortografía."
-    
-    # Obtener clima
-    weather_data = get_weather(location["lat"], location["lon"])
-    
-    if not weather_data:
-        return f"No pude obtener el clima para {location['name']}. Intenta de nuevo más tarde."
-    
-    # Formatear respuesta
+    return _weather_impl(query)
+
+
+# Días del pronóstico y series diarias que se muestran, en orden
+_DAY_NAMES = ("Hoy", "Mañana", "Pasado mañana")
+_DAILY_KEYS = (
+    "temperature_2m_max",
+    "temperature_2m_min",
+    "precipitation_probability_max",
+    "weather_code",
+)
+
+
+def _format_weather(location: Dict[str, Any], weather_data: Dict[str, Any]) -> str:
+    """Formatea el clima actual y el pronóstico de una ubicación."""
     current = weather_data.get("current", {})
     daily = weather_data.get("daily", {})
     
@@ -232,49 +402,149 @@ def weather_tool(query: str) -> str:
     
     weather_desc = weather_code_to_description(weather_code)
     
-    result = f"""🌍 CLIMA EN {location_str.upper()}
+    parts = [
+        f"🌍 CLIMA EN {location_str.upper()}",
+        "",
+        weather_desc,
+        "",
+        f"🌡️ Temperatura actual: {temp}°C",
+        f"🤒 Sensación térmica: {feels_like}°C",
+        f"💧 Humedad: {humidity}%",
+        f"💨 Viento: {wind_speed} km/h ({wind_dir})",
+        f"🌧️ Precipitación: {precipitation} mm",
+        "",
+        "📅 PRONÓSTICO:",
+        "",
+    ]
+    
+    # Pronóstico de los próximos días: zip se detiene en el tercer día,
+    # sin copiar las series de la respuesta
+    for day_name, max_t, min_t, precip, code in zip(
+        _DAY_NAMES, *(daily.get(key, ()) for key in _DAILY_KEYS)
+    ):
+        parts.append(f"   {day_name}: {weather_code_to_description(code)}")
+        parts.append(f"      🌡️ {min_t}°C - {max_t}°C | 💧 {precip}% prob. lluvia")
+    
+    return "\n".join(parts)
 
-{weather_desc}
 
-🌡️ Temperatura actual: {temp}°C
-🤒 Sensación térmica: {feels_like}°C
-💧 Humedad: {humidity}%
-💨 Viento: {wind_speed} km/h ({wind_dir})
-🌧️ Precipitación: {precipitation} mm
+# Cliente httpx compartido (conexiones keep-alive / HTTP/2 entre llamadas);
+# se crea dentro del event loop que lo usa
+_async_client: Optional["httpx.AsyncClient"] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
 
-📅 PRONÓSTICO:
-"""
+
+async def _get_async_client() -> "httpx.AsyncClient":
+    """
+    Devuelve el cliente httpx del loop actual, creándolo si hace falta.
+
+    Si el loop cambió, el cliente anterior se cierra antes de reemplazarlo.
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is not None and not _async_client.is_closed and _async_client_loop is loop:
+        return _async_client
+
+    if _async_client is not None and not _async_client.is_closed:
+        try:
+            await _async_client.aclose()
+        except RuntimeError:
+            # El loop del cliente anterior ya está cerrado
+            pass
+    _async_client_loop = loop
+    _async_client = httpx.AsyncClient(http2=HTTP2_AVAILABLE, timeout=10)
+    return _async_client
+
+
+async def close_async_client() -> None:
+    """Cierra el cliente httpx compartido (al apagar la aplicación)."""
+    global _async_client, _async_client_loop
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = _async_client_loop = None
+
+
+@tool
+async def aweather_tool(query: str) -> str:
+    """
+    Obtiene información del clima actual y pronóstico para una ciudad.
+    
+    Versión asíncrona de weather_tool: usa httpx (con HTTP/2 si está
+    disponible) para no bloquear el event loop.
+    
+    Args:
+        query: Nombre de la ciudad o consulta del clima.
+               Ejemplo: "clima en Madrid"
+               
+    Returns:
+        Información del clima actual y pronóstico de 3 días.
+    """
+    if not HTTPX_AVAILABLE:
+        return await asyncio.to_thread(_weather_impl, query)
     
-    # Pronóstico de los próximos días
-    dias = ["Hoy", "Mañana", "Pasado mañana"]
-    dates = daily.get("time", [])[:3]
-    max_temps = daily.get("temperature_2m_max", [])[:3]
-    min_temps = daily.get("temperature_2m_min", [])[:3]
-    precip_probs = daily.get("precipitation_probability_max", [])[:3]
-    weather_codes = daily.get("weather_code", [])[:3]
+    city = _extract_city(query)
+    if not city:
+        return "Por favor especifica una ciudad. Ejemplo: 'clima en Madrid'"
+    
+    client = await _get_async_client()
+    location = await _ageocode_city(client, city)
+    if not location:
+        return f"No pude encontrar la ciudad: {city}. Intenta con otro nombre o verifica la ortografía."
+    
+    weather_data = await _aget_weather(client, location["lat"], location["lon"])
+    
+    if not weather_data:
+        return f"No pude obtener el clima para {location['name']}. Intenta de nuevo más tarde."
     
-    for i, (date, max_t, min_t, precip, code) in enumerate(zip(
-        dates, max_temps, min_temps, precip_probs, weather_codes
-    )):
-        day_name = dias[i] if i < len(dias) else date
-        desc = weather_code_to_description(code)
-        result += f"\n   {day_name}: {desc}"
-        result += f"\n      🌡️ {min_t}°C - {max_t}°C | 💧 {precip}% prob. lluvia"
+    return _format_weather(location, weather_data)
+
+
+def weather_tool_batch(queries: List[str]) -> List[str]:
+    """
+    Resuelve varias consultas de clima en paralelo.
+
+    Geocodifica todas las ciudades a la vez y luego pide todos los
+    pronósticos a la vez, en lugar de una consulta tras otra.
+
+    Args:
+        queries: Consultas como las que acepta weather_tool
+
+    Returns:
+        Una respuesta por consulta, en el mismo orden
+    """
+    cities = [_extract_city(query) for query in queries]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        locations = list(executor.map(
+            lambda city: geocode_city(city) if city else None, cities
+        ))
+        forecasts = list(executor.map(
+            lambda loc: get_weather(loc["lat"], loc["lon"]) if loc else None, locations
+        ))
     
-    return result
+    results = []
+    for city, location, weather_data in zip(cities, locations, forecasts):
+        if not city:
+            results.append("Por favor especifica una ciudad. Ejemplo: 'clima en Madrid'")
+        elif not location:
+            results.append(f"No pude encontrar la ciudad: {city}. Intenta con otro nombre o verifica la ortografía.")
+        elif not weather_data:
+            results.append(f"No pude obtener el clima para {location['name']}. Intenta de nuevo más tarde.")
+        else:
+            results.append(_format_weather(location, weather_data))
+    return results
 
 
 # Función auxiliar para verificar disponibilidad
 def check_weather_service() -> bool:
     """Verifica si el servicio de clima está disponible."""
     try:
-        response = requests.get(
-            "https://api.open-meteo.com/v1/forecast",
+        response = _SESSION.get(
+            _FORECAST_URL,
             params={"latitude": 0, "longitude": 0, "current": "temperature_2m"},
             timeout=5
         )
         return response.status_code == 200
-    except:
+    except RequestException:
         return False
 
 
@@ -292,6 +562,6 @@ if __name__ == "__main__":
     for query in test_cities:
         print(f"\nConsulta: {query}")
         print("-" * 40)
-        result = weather_tool.invoke(query)
+        result = _weather_impl(query)
         print(result)
         print("=" * 60)
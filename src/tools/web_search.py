@@ -11,8 +11,13 @@ Ejemplo de uso:
     print(result)
 """
 
-from typing import Optional
+import importlib.util
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
 from langchain.tools import tool
+from requests.exceptions import RequestException
 
 # Intentar importar SerpAPI, si no está disponible usar DuckDuckGo
 try:
@@ -21,11 +26,27 @@ try:
 except ImportError:
     SERPAPI_AVAILABLE = False
 
-try:
-    from langchain_community.tools import DuckDuckGoSearchRun
-    DUCKDUCKGO_AVAILABLE = True
-except ImportError:
-    DUCKDUCKGO_AVAILABLE = False
+# DuckDuckGo solo se importa si se usa (arrastra httpx y lxml)
+DUCKDUCKGO_AVAILABLE = importlib.util.find_spec("duckduckgo_search") is not None
+
+_ddgs = None
+
+# Errores esperables de una busqueda; _get_ddgs añade los de DuckDuckGo
+_SEARCH_ERRORS: tuple = (RequestException, ValueError, KeyError)
+
+
+def _get_ddgs():
+    """Devuelve el cliente DDGS compartido, importándolo en el primer uso."""
+    global _ddgs, _SEARCH_ERRORS
+    if _ddgs is None:
+        from duckduckgo_search import DDGS
+        try:
+            from duckduckgo_search.exceptions import DuckDuckGoSearchException
+            _SEARCH_ERRORS += (DuckDuckGoSearchException,)
+        except ImportError:
+            pass
+        _ddgs = DDGS()
+    return _ddgs
 
 
 class WebSearcher:
@@ -33,7 +54,8 @@ class WebSearcher:
     Clase que encapsula la lógica de búsqueda web.
 
     Intenta usar SerpAPI primero (mejor calidad), y si no está
-    disponible, usa DuckDuckGo como alternativa gratuita.
+    disponible, usa DuckDuckGo como alternativa gratuita. El motor
+    se resuelve en la primera búsqueda, no al crear la instancia.
 
     Attributes:
         search_engine: El motor de búsqueda configurado
@@ -49,11 +71,27 @@ class WebSearcher:
         """
         self.search_engine = None
         self.engine_name = "none"
-
+        self._serpapi_key = serpapi_key
+        self._resolved = False
+        self._engine_lock = threading.Lock()
+
+    def _ensure_engine(self) -> None:
+        """Configura el motor de búsqueda la primera vez que se necesita."""
+        if self._resolved:
+            return
+        # Bajo lock: una búsqueda concurrente espera al motor en lugar de
+        # ver _resolved sin motor asignado
+        with self._engine_lock:
+            if not self._resolved:
+                self._resolve_engine()
+                self._resolved = True
+
+    def _resolve_engine(self) -> None:
+        """Elige el motor: SerpAPI si hay key, si no DuckDuckGo."""
         # Intentar configurar SerpAPI
-        if serpapi_key and SERPAPI_AVAILABLE:
+        if self._serpapi_key and SERPAPI_AVAILABLE:
             try:
-                self.search_engine = SerpAPIWrapper(serpapi_api_key=serpapi_key)
+                self.search_engine = SerpAPIWrapper(serpapi_api_key=self._serpapi_key)
                 self.engine_name = "SerpAPI"
                 return
             except Exception:
@@ -62,8 +100,7 @@ class WebSearcher:
         # Fallback a DuckDuckGo
         if DUCKDUCKGO_AVAILABLE:
             try:
-                from duckduckgo_search import DDGS
-                self.search_engine = DDGS()
+                self.search_engine = _get_ddgs()
                 self.engine_name = "DuckDuckGo"
                 return
             except Exception as e:
@@ -79,6 +116,7 @@ class WebSearcher:
         Returns:
             Los resultados de la busqueda como texto
         """
+        self._ensure_engine()
         if self.search_engine is None:
             return (
                 "Error: No hay motor de busqueda disponible. "
@@ -86,29 +124,66 @@ class WebSearcher:
                 "'duckduckgo-search' para DuckDuckGo."
             )
 
+        # La consulta normalizada solo es la clave de cache; al motor se le
+        # envia la original (mayusculas, comillas, etc.)
+        key = (self, query.strip().lower())
+        result = _search_cache_get(key)
+        if result is not None:
+            return result
+
         try:
-            if self.engine_name == "SerpAPI":
-                result = self.search_engine.run(query)
-            else:
-                # DuckDuckGo usando DDGS directamente
-                results = self.search_engine.text(query, max_results=5)
-                if results:
-                    formatted = []
-                    for r in results:
-                        formatted.append(f"- {r.get('title', '')}: {r.get('body', '')}")
-                    result = "\n".join(formatted)
-                else:
-                    result = None
-
-            return result if result else "No se encontraron resultados."
-
-        except Exception as e:
+            result = self._run_search(query)
+        except _SEARCH_ERRORS as e:
             return f"Error en la busqueda: {str(e)}"
+        _search_cache_put(key, result)
+        return result
+
+    def _run_search(self, query: str) -> str:
+        """Ejecuta la busqueda en el motor configurado (sin cache)."""
+        if self.engine_name == "SerpAPI":
+            result = self.search_engine.run(query)
+        else:
+            # DuckDuckGo usando DDGS directamente
+            results = self.search_engine.text(query, max_results=5)
+            result = "\n".join(
+                f"- {r.get('title', '')}: {r.get('body', '')}" for r in results
+            ) if results else None
+
+        return result if result else "No se encontraron resultados."
+
+
+# Cache LRU de busquedas recientes por (buscador, consulta normalizada);
+# los errores no se guardan
+SEARCH_CACHE_SIZE = 128
+_search_cache: "OrderedDict[Tuple[WebSearcher, str], str]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_get(key: Tuple[WebSearcher, str]) -> Optional[str]:
+    """Obtiene una busqueda cacheada y la marca como usada recientemente."""
+    with _search_cache_lock:
+        result = _search_cache.get(key)
+        if result is not None:
+            _search_cache.move_to_end(key)
+        return result
+
+
+def _search_cache_put(key: Tuple[WebSearcher, str], result: str) -> None:
+    """Guarda una busqueda, descartando la menos usada si se llena."""
+    with _search_cache_lock:
+        _search_cache[key] = result
+        _search_cache.move_to_end(key)
+        if len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
 
 
 # Instancia global del buscador (se configura en el agente)
 _searcher: Optional[WebSearcher] = None
 
+# Inicializacion en segundo plano (ver initialize_searcher_async)
+_init_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="web-search-init")
+_searcher_future: Optional[Future] = None
+
 
 def initialize_searcher(serpapi_key: Optional[str] = None) -> WebSearcher:
     """
@@ -122,24 +197,53 @@ def initialize_searcher(serpapi_key: Optional[str] = None) -> WebSearcher:
     """
     global _searcher
     _searcher = WebSearcher(serpapi_key)
+    with _search_cache_lock:
+        _search_cache.clear()
     return _searcher
 
 
+def initialize_searcher_async(serpapi_key: Optional[str] = None) -> Future:
+    """
+    Inicializa el buscador web global en segundo plano.
+
+    get_searcher() espera a que termine la inicializacion en el primer uso,
+    asi que el agente puede arrancar sin esperar al buscador.
+
+    Args:
+        serpapi_key: API key de SerpAPI
+
+    Returns:
+        Future que resuelve a la instancia del buscador
+    """
+    global _searcher_future
+    _searcher_future = _init_executor.submit(initialize_searcher, serpapi_key)
+    return _searcher_future
+
+
 def get_searcher() -> WebSearcher:
     """
     Obtiene la instancia del buscador web.
 
+    Si hay una inicializacion en segundo plano, espera a que termine.
     Si no está inicializado, crea uno con configuración por defecto.
 
     Returns:
         La instancia del buscador
     """
     global _searcher
+    if _searcher_future is not None:
+        _searcher_future.result()
     if _searcher is None:
         _searcher = WebSearcher()
     return _searcher
 
 
+def _web_search_impl(query: str) -> str:
+    """Implementación de web_search_tool (llamable sin pasar por LangChain)."""
+    searcher = get_searcher()
+    return searcher.search(query)
+
+
 @tool
 def web_search_tool(query: str) -> str:
     """
@@ -163,8 +267,7 @@ def web_search_tool(query: str) -> str:
         Si SerpAPI está configurado, se usará para mejores resultados.
         De lo contrario, se usa DuckDuckGo como alternativa gratuita.
     """
-    searcher = get_searcher()
-    return searcher.search(query)
+    return _web_search_impl(query)
 
 
 # Información sobre el estado del buscador
@@ -176,6 +279,7 @@ def get_search_status() -> dict:
         Dict con información del motor de búsqueda activo
     """
     searcher = get_searcher()
+    searcher._ensure_engine()
     return {
         "engine": searcher.engine_name,
         "available": searcher.search_engine is not None,
@@ -196,5 +300,5 @@ if __name__ == "__main__":
     print("\nPrueba de búsqueda:")
     print("-" * 40)
 
-    result = web_search_tool.invoke("Python programming language")
+    result = _web_search_impl("Python programming language")
     print(result[:500] + "..." if len(result) > 500 else result)
@@ -11,21 +11,317 @@ Ejemplo de uso:
     print(result)
 """
 
-from typing import Optional
+import asyncio
+import importlib.util
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from langchain.tools import tool
+from src.tools.compression import pack as _pack, unpack as _unpack
 
-# Intentar importar Wikipedia
-try:
-    from langchain_community.utilities import WikipediaAPIWrapper
-    WIKIPEDIA_AVAILABLE = True
-except ImportError:
-    WIKIPEDIA_AVAILABLE = False
+# Wikipedia solo se importa al usarse (langchain_community y wikipedia son lentos de cargar)
+WIKIPEDIA_AVAILABLE = importlib.util.find_spec("langchain_community") is not None
+WIKIPEDIA_DIRECT_AVAILABLE = importlib.util.find_spec("wikipedia") is not None
 
+# Reintentos con backoff exponencial opcionales
 try:
-    import wikipedia
-    WIKIPEDIA_DIRECT_AVAILABLE = True
+    from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+    TENACITY_AVAILABLE = True
 except ImportError:
-    WIKIPEDIA_DIRECT_AVAILABLE = False
+    TENACITY_AVAILABLE = False
+
+# Cliente HTTP asíncrono opcional (wikipedia_tool_async); se importa al usarse
+AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
+
+_API_URL = "https://{lang}.wikipedia.org/w/api.php"
+
+# Códigos HTTP que indican un fallo pasajero (límite de peticiones, servidor caído)
+_TRANSIENT_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# prop=extracts devuelve como máximo 20 introducciones por petición
+_EXTRACTS_PER_REQUEST = 20
+
+# Parámetros por defecto de WikipediaAPIWrapper (solo lectura)
+_DEFAULT_WRAPPER_KWARGS = MappingProxyType({
+    "top_k_results": 3,
+    "doc_content_chars_max": 4000,
+})
+
+# Lo que devuelve WikipediaAPIWrapper.run() cuando no encuentra artículos
+_WRAPPER_NO_RESULT = "No good Wikipedia Search Result was found"
+# Largo máximo de consulta que WikipediaAPIWrapper envía a la búsqueda
+_WRAPPER_MAX_QUERY_LENGTH = 300
+
+# Cache LRU de respuestas por (buscador, consulta normalizada), comprimidas
+# con _pack; los errores no se guardan
+SUMMARY_CACHE_SIZE = 512
+_SUMMARY_CACHE: "OrderedDict[Tuple[Any, str], Union[bytes, str]]" = OrderedDict()
+_summary_cache_lock = threading.Lock()
+
+# Cache negativo: consultas sin artículo, para no repetir la petición
+MISS_CACHE_TTL = 300  # segundos
+MISS_CACHE_SIZE = 1024
+_MISS_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
+# search_many guarda fallos desde varios hilos
+_miss_cache_lock = threading.Lock()
+
+# Sesión HTTP compartida: reutiliza las conexiones TLS con Wikipedia.
+# Una sola capa de reintentos: con tenacity los hace _retry_transient (que
+# envuelve todas las llamadas de red, incluida wiki.run) y el adapter no
+# reintenta; sin tenacity los hace el adapter
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=0 if TENACITY_AVAILABLE else Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_wikipedia():
+    """Importa la librería wikipedia en el primer uso."""
+    import wikipedia
+
+    # La librería (y WikipediaAPIWrapper, que la usa por debajo) hace
+    # requests.get() en cada llamada; se le inyecta la sesión compartida
+    wikipedia.wikipedia.requests = _SESSION
+    return wikipedia
+
+
+@lru_cache(maxsize=1)
+def _get_aiohttp():
+    """Importa aiohttp en el primer uso."""
+    import aiohttp
+    return aiohttp
+
+
+@lru_cache(maxsize=1)
+def _get_wrapper_cls():
+    """Importa WikipediaAPIWrapper en el primer uso."""
+    from langchain_community.utilities import WikipediaAPIWrapper
+
+    if WIKIPEDIA_DIRECT_AVAILABLE:
+        _get_wikipedia()
+    return WikipediaAPIWrapper
+
+
+class _RevisionStore:
+    """
+    Resúmenes guardados por artículo junto con su id de revisión.
+
+    Se persiste en SQLite (resúmenes comprimidos con zstd si está
+    disponible); si el archivo no se puede usar (p. ej. HOME de solo lectura)
+    se usa una base en memoria, y si tampoco se puede, el almacén no guarda
+    nada. Los errores de SQLite nunca llegan a quien busca.
+    """
+
+    def __init__(self, path: Path):
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        for target in (path, None):
+            try:
+                self._db = self._open(target)
+                break
+            except (OSError, sqlite3.Error):
+                continue
+
+    @staticmethod
+    def _open(path: Optional[Path]) -> sqlite3.Connection:
+        """Abre la base (en memoria si path es None) y crea la tabla."""
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(":memory:" if path is None else str(path), check_same_thread=False)
+        try:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "lang TEXT, title TEXT, revid INTEGER, summary TEXT, "
+                "PRIMARY KEY (lang, title))"
+            )
+        except sqlite3.Error:
+            db.close()
+            raise
+        return db
+
+    def get(self, lang: str, title: str) -> Optional[Tuple[int, str]]:
+        if self._db is None:
+            return None
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT revid, summary FROM summaries WHERE lang = ? AND title = ?",
+                    (lang, title),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        summary = _unpack(row[1])
+        return None if summary is None else (row[0], summary)
+
+    def put(self, lang: str, title: str, revid: int, summary: str) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?)",
+                    (lang, title, revid, _pack(summary)),
+                )
+                self._db.commit()
+        except sqlite3.Error:
+            pass
+
+
+@lru_cache(maxsize=1)
+def _get_revisions() -> _RevisionStore:
+    """Abre el almacén de revisiones en el primer uso (no al importar el módulo)."""
+    return _RevisionStore(
+        Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "papuproject" / "wiki_revisions.sqlite3"
+    )
+
+
+def _is_transient(error: BaseException) -> bool:
+    """True si el error de red merece reintentarse."""
+    if isinstance(error, requests.HTTPError):
+        return error.response is not None and error.response.status_code in _TRANSIENT_STATUS
+    return isinstance(error, (requests.Timeout, requests.ConnectionError))
+
+
+def _retry_transient(func):
+    """
+    Reintenta func ante errores de red pasajeros (hasta 4 intentos, con
+    backoff exponencial aleatorio entre 0.5 y 8 s).
+
+    Los demás errores (p. ej. DisambiguationError) se propagan en el
+    primer intento. Sin tenacity instalado, devuelve func sin cambios.
+    """
+    if not TENACITY_AVAILABLE:
+        return func
+    return retry(
+        retry=retry_if_exception(_is_transient),
+        wait=wait_random_exponential(min=0.5, max=8),
+        stop=stop_after_attempt(4),
+        reraise=True,
+    )(func)
+
+
+@_retry_transient
+def _wiki_call(func, *args, **kwargs):
+    """Llama a una función de la librería wikipedia con reintentos."""
+    return func(*args, **kwargs)
+
+
+@_retry_transient
+def _query_page(lang: str, title: str, **params: Any) -> Dict[str, Any]:
+    """Consulta la API de MediaWiki para un título y devuelve su página."""
+    response = _SESSION.get(
+        _API_URL.format(lang=lang),
+        params={
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "redirects": 1,
+            "titles": title,
+            **params,
+        },
+        timeout=10,
+    )
+    response.raise_for_status()
+    return response.json()["query"]["pages"][0]
+
+
+def _article_summary(lang: str, title: str) -> Optional[str]:
+    """
+    Resumen (5 oraciones) de un artículo, descargado solo si cambió.
+
+    Primero pide el id de la revisión actual (respuesta de pocos bytes); si
+    coincide con el guardado devuelve el resumen guardado, si no descarga
+    el extracto y lo guarda.
+
+    Returns:
+        El resumen, o None si la página no existe o es de desambiguación
+    """
+    page = _query_page(lang, title, prop="revisions|pageprops", rvprop="ids", ppprop="disambiguation")
+    if page.get("missing") or "disambiguation" in page.get("pageprops", {}):
+        return None
+
+    resolved = page["title"]
+    revisions = _get_revisions()
+    cached = revisions.get(lang, resolved)
+    if cached is not None and cached[0] == page["revisions"][0]["revid"]:
+        return cached[1]
+
+    page = _query_page(
+        lang, resolved, prop="extracts|revisions", rvprop="ids", explaintext=1, exsentences=5
+    )
+    summary = page.get("extract", "")
+    revisions.put(lang, resolved, page["revisions"][0]["revid"], summary)
+    return summary
+
+
+def _cached_miss(key: Tuple[str, str]) -> Optional[str]:
+    """Devuelve el mensaje de "no encontrado" en cache si no ha expirado."""
+    cached = _MISS_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < MISS_CACHE_TTL:
+        return cached[1]
+    return None
+
+
+def _store_miss(key: Tuple[str, str], message: str) -> None:
+    """Guarda un "no encontrado", descartando la entrada más antigua si está lleno."""
+    with _miss_cache_lock:
+        _MISS_CACHE.pop(key, None)
+        if len(_MISS_CACHE) >= MISS_CACHE_SIZE:
+            _MISS_CACHE.pop(next(iter(_MISS_CACHE), None), None)
+        _MISS_CACHE[key] = (time.monotonic(), message)
+
+
+def _summary_cache_get(key: Tuple[Any, str]) -> Optional[str]:
+    """Obtiene una respuesta cacheada y la marca como usada recientemente."""
+    with _summary_cache_lock:
+        value = _SUMMARY_CACHE.get(key)
+        if value is None:
+            return None
+        _SUMMARY_CACHE.move_to_end(key)
+    return _unpack(value)
+
+
+def _summary_cache_put(key: Tuple[Any, str], result: str) -> None:
+    """Guarda una respuesta, descartando la menos usada si se llena."""
+    value = _pack(result)
+    with _summary_cache_lock:
+        _SUMMARY_CACHE[key] = value
+        _SUMMARY_CACHE.move_to_end(key)
+        if len(_SUMMARY_CACHE) > SUMMARY_CACHE_SIZE:
+            _SUMMARY_CACHE.popitem(last=False)
+
+
+def _format_wrapper_pages(pages: List[Tuple[str, str]], chars_max: int) -> str:
+    """Da a (título, introducción) el mismo formato que WikipediaAPIWrapper.run()."""
+    text = "\n\n".join(f"Page: {title}\nSummary: {extract}" for title, extract in pages)
+    return text[:chars_max]
+
+
+class _UncachedResult(Exception):
+    """Respuesta de error que se devuelve al usuario pero no se guarda en cache."""
+
+
+class _NotFound(Exception):
+    """Wikipedia no tiene artículos para la consulta (el mensaje va al usuario)."""
 
 
 class WikipediaSearcher:
@@ -38,9 +334,17 @@ class WikipediaSearcher:
     Attributes:
         wiki: El wrapper de Wikipedia de LangChain
         available: Si Wikipedia está disponible
+        semantic_cache: Cache semántico en disco (WIKI_SEMANTIC_CACHE=1), o None
     """
 
-    def __init__(self, lang: str = "es", top_k_results: int = 3, doc_content_chars_max: int = 4000):
+    __slots__ = ("available", "wiki", "lang", "semantic_cache")
+
+    def __init__(
+        self,
+        lang: str = "es",
+        top_k_results: int = _DEFAULT_WRAPPER_KWARGS["top_k_results"],
+        doc_content_chars_max: int = _DEFAULT_WRAPPER_KWARGS["doc_content_chars_max"],
+    ):
         """
         Inicializa el buscador de Wikipedia.
 
@@ -52,10 +356,16 @@ class WikipediaSearcher:
         self.available = False
         self.wiki = None
         self.lang = lang
+        self.semantic_cache = None
+
+        # Cache semántico opcional: reutiliza respuestas de consultas parecidas
+        if os.getenv("WIKI_SEMANTIC_CACHE") == "1":
+            from src.tools.semantic_cache import open_semantic_cache
+            self.semantic_cache = open_semantic_cache(f"wikipedia_{lang}")
 
         if WIKIPEDIA_AVAILABLE:
             try:
-                self.wiki = WikipediaAPIWrapper(
+                self.wiki = _get_wrapper_cls()(
                     lang=lang,
                     top_k_results=top_k_results,
                     doc_content_chars_max=doc_content_chars_max
@@ -74,17 +384,215 @@ class WikipediaSearcher:
         Returns:
             Resumen del artículo de Wikipedia
         """
+        # La forma normalizada es solo la clave de cache: a Wikipedia (y a
+        # los mensajes) va la consulta original
+        query = query.strip()
+        key = query.casefold()
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        try:
+            return self._fetch(query, key)
+        except _UncachedResult as e:
+            return str(e)
+
+    def _cached(self, key: str) -> Optional[str]:
+        """Respuesta en cache (negativo o LRU) para una consulta normalizada."""
+        miss = _cached_miss((self.lang, key))
+        if miss is not None:
+            return miss
+        return _summary_cache_get((self, key))
+
+    def _remember(self, key: str, result: str) -> None:
+        """Guarda un artículo encontrado en el LRU y en el cache semántico."""
+        if self.semantic_cache is not None:
+            self.semantic_cache.put(key, result)
+        _summary_cache_put((self, key), result)
+
+    def _not_found(self, query: str, key: str) -> str:
+        """Registra en el cache negativo una consulta sin artículos."""
+        message = f"No se encontró información sobre '{query}' en Wikipedia."
+        _store_miss((self.lang, key), message)
+        return message
+
+    def search_many(self, queries: List[str]) -> List[str]:
+        """
+        Busca varios temas pidiendo sus introducciones juntas (titles=A|B|C).
+
+        Usa los mismos caches que search() y guarda en ellos lo que
+        descarga, con el mismo formato. Las consultas que no coinciden con
+        el título de un artículo (o dan una página de desambiguación) se
+        resuelven una a una con search().
+
+        Args:
+            queries: Los términos a buscar
+
+        Returns:
+            Un resumen por consulta, en el mismo orden
+        """
+        queries = [query.strip() for query in queries]
+        normalized = [query.casefold() for query in queries]
+        results: Dict[str, str] = {}
+        # Consulta normalizada -> título a pedir (la consulta original: los
+        # títulos distinguen mayúsculas después de la primera letra)
+        titles: Dict[str, str] = {}
+        for query, key in zip(queries, normalized):
+            if key in results or key in titles:
+                continue
+            cached = self._cached(key)
+            if cached is not None:
+                results[key] = cached
+            elif key and "|" not in key and self.semantic_cache is None:
+                titles[key] = query
+
+        pending = list(titles.items())
+        for start in range(0, len(pending), _EXTRACTS_PER_REQUEST):
+            chunk = dict(pending[start:start + _EXTRACTS_PER_REQUEST])
+            try:
+                extracts = self._fetch_extracts(list(chunk.values()))
+            except (requests.RequestException, ValueError, KeyError):
+                continue
+            for key, title in chunk.items():
+                if title in extracts:
+                    result = self._format_page(*extracts[title])
+                    self._remember(key, result)
+                    results[key] = result
+
+        return [
+            results[key] if key in results else self.search(query)
+            for query, key in zip(queries, normalized)
+        ]
+
+    def _format_page(self, title: str, extract: str) -> str:
+        """Formato de search() para un artículo: el del wrapper o el del fallback."""
+        if self.available:
+            return _format_wrapper_pages([(title, extract)], self.wiki.doc_content_chars_max)
+        return f"**{title}**\n\n{extract}"
+
+    @_retry_transient
+    def _fetch_extracts(self, titles: List[str]) -> Dict[str, Tuple[str, str]]:
+        """
+        Introducciones de varios artículos en una petición.
+
+        Returns:
+            Título pedido -> (título del artículo, introducción)
+        """
+        params = {
+            "action": "query",
+            "format": "json",
+            "formatversion": 2,
+            "redirects": 1,
+            "titles": "|".join(titles),
+            "prop": "extracts|pageprops",
+            "ppprop": "disambiguation",
+            "exintro": 1,
+            "explaintext": 1,
+            "exlimit": "max",
+        }
         if not self.available:
-            return self._fallback_search(query)
+            # El fallback resume en 5 oraciones
+            params["exsentences"] = 5
+        response = _SESSION.get(_API_URL.format(lang=self.lang), params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()["query"]
+
+        # Título pedido -> título normalizado -> destino de la redirección
+        renamed = {item["from"]: item["to"] for item in data.get("normalized", ())}
+        redirects = {item["from"]: item["to"] for item in data.get("redirects", ())}
+        pages = {page["title"]: page for page in data.get("pages", ())}
+
+        extracts = {}
+        for title in titles:
+            name = renamed.get(title, title)
+            name = redirects.get(name, name)
+            page = pages.get(name)
+            if (
+                page is None
+                or page.get("missing")
+                or not page.get("extract")
+                or "disambiguation" in page.get("pageprops", {})
+            ):
+                continue
+            extracts[title] = (name, page["extract"])
+        return extracts
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Vacía el cache de consultas compartido por todos los buscadores."""
+        with _summary_cache_lock:
+            _SUMMARY_CACHE.clear()
+        with _miss_cache_lock:
+            _MISS_CACHE.clear()
+
+    def _fetch(self, query: str, key: str) -> str:
+        """Consulta Wikipedia sin cache LRU (los errores se lanzan como _UncachedResult)."""
+        semantic_cache = self.semantic_cache
+        if semantic_cache is not None:
+            cached = semantic_cache.get(key)
+            if cached is not None:
+                _summary_cache_put((self, key), cached)
+                return cached
 
         try:
-            result = self.wiki.run(query)
-            return result if result else f"No se encontró información sobre '{query}' en Wikipedia."
+            result = self._fetch_remote(query)
+        except _NotFound as e:
+            # Los "no encontrado" van al cache negativo (con caducidad), no al LRU
+            _store_miss((self.lang, key), str(e))
+            raise _UncachedResult(str(e)) from None
+
+        # Solo se guardan artículos encontrados: un "no encontrado" no sirve
+        # como respuesta para una consulta parecida
+        self._remember(key, result)
+        return result
+
+    async def _afetch(self, query: str) -> str:
+        """
+        Versión asíncrona de search() para wikipedia_tool_async.
 
+        Usa los mismos caches que search(). Con el wrapper de LangChain
+        disponible, pide con aiohttp la búsqueda y las introducciones de
+        los primeros resultados en una sola petición y les da el mismo
+        formato que el wrapper; en los demás casos (sin aiohttp, con cache
+        semántico, o si la petición falla) usa search() en un hilo.
+        """
+        query = query.strip()
+        key = query.casefold()
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        if self.available and AIOHTTP_AVAILABLE and self.semantic_cache is None:
+            aiohttp = _get_aiohttp()
+            try:
+                pages = await _afetch_pages(self.lang, query, self.wiki.top_k_results)
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError):
+                pages = None
+            if pages is not None:
+                if not pages:
+                    return self._not_found(query, key)
+                result = _format_wrapper_pages(pages, self.wiki.doc_content_chars_max)
+                self._remember(key, result)
+                return result
+
+        return await asyncio.to_thread(self.search, query)
+
+    def _fetch_remote(self, query: str) -> str:
+        """Consulta Wikipedia por red (lanza _NotFound si no hay artículos)."""
+        if not self.available:
+            return self._fallback_search(query)
+
+        try:
+            # Los errores de red pasajeros se reintentan antes del fallback
+            result = _wiki_call(self.wiki.run, query)
         except Exception as e:
             # Intentar fallback si falla
             return self._fallback_search(query)
 
+        if not result or result.startswith(_WRAPPER_NO_RESULT):
+            raise _NotFound(f"No se encontró información sobre '{query}' en Wikipedia.")
+        return result
+
     def _fallback_search(self, query: str) -> str:
         """
         Búsqueda alternativa usando la librería wikipedia directamente.
@@ -96,39 +604,54 @@ class WikipediaSearcher:
             Resumen del artículo
         """
         if not WIKIPEDIA_DIRECT_AVAILABLE:
-            return (
+            raise _UncachedResult(
                 "Error: Wikipedia no está disponible. "
                 "Instala 'wikipedia' con: pip install wikipedia"
             )
 
         try:
+            wikipedia = _get_wikipedia()
+
             # Configurar idioma
             wikipedia.set_lang(self.lang)
 
             # Buscar artículo
-            search_results = wikipedia.search(query, results=3)
+            search_results = _wiki_call(wikipedia.search, query, results=3)
 
             if not search_results:
-                return f"No se encontraron artículos sobre '{query}' en Wikipedia."
+                raise _NotFound(f"No se encontraron artículos sobre '{query}' en Wikipedia.")
+
+            # Obtener resumen del primer resultado (sin descargarlo si no cambió)
+            summary = _article_summary(self.lang, search_results[0])
+            if summary is not None:
+                return f"**{search_results[0]}**\n\n{summary}"
 
-            # Obtener resumen del primer resultado
+            # Desambiguación (o título inexistente): la librería resuelve las opciones
             try:
-                summary = wikipedia.summary(search_results[0], sentences=5)
+                summary = _wiki_call(wikipedia.summary, search_results[0], sentences=5)
                 return f"**{search_results[0]}**\n\n{summary}"
             except wikipedia.DisambiguationError as e:
                 # Si hay ambigüedad, tomar la primera opción
                 if e.options:
-                    summary = wikipedia.summary(e.options[0], sentences=5)
+                    summary = _wiki_call(wikipedia.summary, e.options[0], sentences=5)
                     return f"**{e.options[0]}**\n\n{summary}"
                 return f"Término ambiguo. Opciones: {', '.join(e.options[:5])}"
 
+        except _NotFound:
+            raise
         except Exception as e:
-            return f"Error al consultar Wikipedia: {str(e)}"
+            raise _UncachedResult(f"Error al consultar Wikipedia: {str(e)}") from e
 
 
 # Instancia global del buscador
 _wiki_searcher: Optional[WikipediaSearcher] = None
 
+# Inicializacion en segundo plano (ver initialize_wikipedia_async)
+_init_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wikipedia-init")
+_wiki_future: Optional[Future] = None
+# Evita que dos hilos creen a la vez el buscador por defecto
+_wiki_lock = threading.Lock()
+
 
 def initialize_wikipedia(lang: str = "es") -> WikipediaSearcher:
     """
@@ -145,19 +668,117 @@ def initialize_wikipedia(lang: str = "es") -> WikipediaSearcher:
     return _wiki_searcher
 
 
+def initialize_wikipedia_async(lang: str = "es") -> Future:
+    """
+    Inicializa el buscador de Wikipedia en segundo plano.
+
+    get_wikipedia_searcher() espera a que termine en el primer uso.
+
+    Args:
+        lang: Código de idioma ("es", "en", etc.)
+
+    Returns:
+        Future que resuelve a la instancia del buscador
+    """
+    global _wiki_future
+    _wiki_future = _init_executor.submit(initialize_wikipedia, lang)
+    return _wiki_future
+
+
 def get_wikipedia_searcher() -> WikipediaSearcher:
     """
     Obtiene la instancia del buscador de Wikipedia.
 
+    Si hay una inicializacion en segundo plano, espera a que termine.
+
     Returns:
         La instancia del buscador
     """
     global _wiki_searcher
+    if _wiki_future is not None:
+        _wiki_future.result()
     if _wiki_searcher is None:
-        _wiki_searcher = WikipediaSearcher()
+        with _wiki_lock:
+            if _wiki_searcher is None:
+                _wiki_searcher = WikipediaSearcher()
     return _wiki_searcher
 
 
+# Sesión aiohttp compartida; se crea dentro del event loop que la usa
+_aio_session: Optional["aiohttp.ClientSession"] = None
+_aio_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_aio_session() -> "aiohttp.ClientSession":
+    """
+    Devuelve la sesión aiohttp del loop actual, creándola si hace falta.
+
+    Si el loop cambió, la sesión anterior se cierra antes de reemplazarla.
+    """
+    global _aio_session, _aio_loop
+    aiohttp = _get_aiohttp()
+    loop = asyncio.get_running_loop()
+    if _aio_session is not None and not _aio_session.closed and _aio_loop is loop:
+        return _aio_session
+
+    if _aio_session is not None and not _aio_session.closed:
+        try:
+            await _aio_session.close()
+        except RuntimeError:
+            # El loop de la sesión anterior ya está cerrado
+            pass
+    _aio_loop = loop
+    _aio_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
+    return _aio_session
+
+
+async def close_aio_session() -> None:
+    """Cierra la sesión aiohttp compartida (al apagar la aplicación)."""
+    global _aio_session, _aio_loop
+    if _aio_session is not None and not _aio_session.closed:
+        await _aio_session.close()
+    _aio_session = _aio_loop = None
+
+
+async def _afetch_pages(lang: str, query: str, limit: int) -> List[Tuple[str, str]]:
+    """
+    Busca la consulta y trae las introducciones de los primeros resultados
+    en una sola petición (generator=search + prop=extracts).
+
+    Como WikipediaAPIWrapper, omite las páginas de desambiguación.
+
+    Returns:
+        Lista de (título, introducción) en el orden de la búsqueda
+    """
+    params = {
+        "action": "query",
+        "format": "json",
+        "formatversion": 2,
+        "generator": "search",
+        "gsrsearch": query[:_WRAPPER_MAX_QUERY_LENGTH],
+        "gsrlimit": limit,
+        "prop": "extracts|pageprops",
+        "ppprop": "disambiguation",
+        "exintro": 1,
+        "explaintext": 1,
+        "exlimit": "max",
+    }
+    session = await _get_aio_session()
+    async with session.get(_API_URL.format(lang=lang), params=params) as response:
+        response.raise_for_status()
+        data = await response.json()
+
+    pages = sorted(data.get("query", {}).get("pages", ()), key=lambda page: page["index"])
+    return [
+        (page["title"], page["extract"])
+        for page in pages
+        if page.get("extract") and "disambiguation" not in page.get("pageprops", {})
+    ]
+
+
 @tool
 def wikipedia_tool(query: str) -> str:
     """
@@ -185,6 +806,42 @@ def wikipedia_tool(query: str) -> str:
     return searcher.search(query)
 
 
+def get_wikipedia_langchain_tool():
+    """
+    Devuelve la herramienta wikipedia_tool ya construida.
+
+    @tool genera el esquema de argumentos una sola vez, al importar el
+    módulo; los agentes deben reutilizar esta instancia en lugar de volver
+    a decorar la función.
+
+    Returns:
+        La herramienta de LangChain wikipedia_tool
+    """
+    return wikipedia_tool
+
+
+@tool
+async def wikipedia_tool_async(query: str) -> str:
+    """
+    Consulta información enciclopédica en Wikipedia.
+
+    Versión asíncrona de wikipedia_tool: usa aiohttp con una sesión
+    compartida, así varias consultas simultáneas no se bloquean entre sí.
+    Comparte los caches y el formato de respuesta con wikipedia_tool.
+
+    Args:
+        query: El tema o término a buscar.
+               Ejemplo: "Albert Einstein", "Segunda Guerra Mundial", "Fotosíntesis"
+
+    Returns:
+        Un resumen del artículo de Wikipedia sobre el tema.
+    """
+    if _wiki_future is not None:
+        await asyncio.wrap_future(_wiki_future)
+    searcher = get_wikipedia_searcher()
+    return await searcher._afetch(query)
+
+
 # Información sobre el estado de Wikipedia
 def get_wikipedia_status() -> dict:
     """
@@ -196,7 +853,10 @@ def get_wikipedia_status() -> dict:
     return {
         "langchain_wrapper_available": WIKIPEDIA_AVAILABLE,
         "wikipedia_direct_available": WIKIPEDIA_DIRECT_AVAILABLE,
+        "aiohttp_available": AIOHTTP_AVAILABLE,
         "configured": _wiki_searcher is not None,
+        "cache": {"size": len(_SUMMARY_CACHE), "maxsize": SUMMARY_CACHE_SIZE},
+        "miss_cache_size": len(_MISS_CACHE),
     }
 
 
@@ -5,11 +5,17 @@ Este módulo contiene utilidades y funciones de ayuda
 usadas en todo el proyecto.
 """
 
+import io
 import logging
+import re
+from collections import Counter
 from typing import Any, Dict, List
 from functools import wraps
 import time
 
+# Logger de timing_decorator (nivel DEBUG; hijo del logger "agent")
+_timing_logger = logging.getLogger("agent.timing")
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """
@@ -34,6 +40,8 @@ def timing_decorator(func):
     """
     Decorador para medir el tiempo de ejecución de una función.
 
+    La duración se registra en el logger "agent.timing" con nivel DEBUG.
+
     Usage:
         @timing_decorator
         def my_function():
@@ -41,11 +49,11 @@ def timing_decorator(func):
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end_time = time.time()
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
-        print(f"⏱️  {func.__name__} ejecutado en {end_time - start_time:.2f}s")
+        _timing_logger.debug("⏱️  %s ejecutado en %.3f ms", func.__name__, elapsed_ns / 1e6)
         return result
 
     return wrapper
@@ -62,18 +70,41 @@ def format_agent_response(response: str, steps: List = None) -> str:
     Returns:
         Respuesta formateada
     """
-    output = []
+    output = io.StringIO()
 
     if steps:
-        output.append("📝 Pasos del razonamiento:")
+        output.write("📝 Pasos del razonamiento:\n")
         for i, (action, observation) in enumerate(steps, 1):
-            output.append(f"   {i}. {action.tool}: {action.tool_input[:50]}...")
-            output.append(f"      → {observation[:100]}...")
-        output.append("")
-
-    output.append(f"✅ Respuesta: {response}")
-
-    return "\n".join(output)
+            tool_input = action.tool_input[:50]
+            output.write(f"   {i}. {action.tool}: {tool_input}...\n      → {observation[:100]}...\n")
+        output.write("\n")
+
+    output.write(f"✅ Respuesta: {response}")
+
+    return output.getvalue()
+
+
+# Reemplazos comunes para parse_math_expression
+_MATH_REPLACEMENTS = {
+    " por ": " * ",
+    " multiplicado por ": " * ",
+    " dividido entre ": " / ",
+    " entre ": " / ",
+    " más ": " + ",
+    " menos ": " - ",
+    " al cuadrado": " ** 2",
+    " al cubo": " ** 3",
+    " elevado a ": " ** ",
+    "raíz cuadrada de ": "sqrt(",
+    "raiz cuadrada de ": "sqrt(",
+    "porcentaje": "/ 100 *",
+    "% de ": " / 100 * ",
+}
+# Una sola pasada; las claves más largas primero (" multiplicado por "
+# antes que " por ")
+_MATH_RE = re.compile(
+    "|".join(re.escape(key) for key in sorted(_MATH_REPLACEMENTS, key=len, reverse=True))
+)
 
 
 def parse_math_expression(text: str) -> str:
@@ -90,26 +121,7 @@ def parse_math_expression(text: str) -> str:
         >>> parse_math_expression("¿Cuánto es 25 por 4?")
         "25 * 4"
     """
-    # Reemplazos comunes
-    replacements = {
-        " por ": " * ",
-        " multiplicado por ": " * ",
-        " dividido entre ": " / ",
-        " entre ": " / ",
-        " más ": " + ",
-        " menos ": " - ",
-        " al cuadrado": " ** 2",
-        " al cubo": " ** 3",
-        " elevado a ": " ** ",
-        "raíz cuadrada de ": "sqrt(",
-        "raiz cuadrada de ": "sqrt(",
-        "porcentaje": "/ 100 *",
-        "% de ": " / 100 * ",
-    }
-
-    result = text.lower()
-    for old, new in replacements.items():
-        result = result.replace(old, new)
+    result = _MATH_RE.sub(lambda match: _MATH_REPLACEMENTS[match.group()], text.lower())
 
     # Cerrar paréntesis de sqrt si es necesario
     if "sqrt(" in result and ")" not in result:
@@ -138,7 +150,7 @@ def validate_api_key(api_key: str, service: str = "DeepSeek") -> bool:
     if len(api_key) < 10:
         raise ValueError(f"API key de {service} parece demasiado corta")
 
-    if api_key.startswith("sk-") or api_key.startswith("api-"):
+    if api_key.startswith(("sk-", "api-")):
         return True
 
     # Aceptar otros formatos pero con advertencia
@@ -171,39 +183,69 @@ class AgentMetrics:
     """
 
     def __init__(self):
-        self.total_queries = 0
-        self.total_tool_calls = 0
-        self.tool_usage: Dict[str, int] = {}
-        self.total_time = 0.0
-        self.errors = 0
+        # Las métricas solo cambian a través de record_query/record_error,
+        # así la caché de get_summary() nunca queda desactualizada
+        self._total_queries = 0
+        self._total_tool_calls = 0
+        self._tool_usage: Counter = Counter()
+        self._total_time = 0.0
+        self._errors = 0
+        # get_summary() se recalcula solo si cambió alguna métrica
+        self._dirty = True
+        self._summary_cache: Dict[str, Any] = {}
+
+    @property
+    def total_queries(self) -> int:
+        return self._total_queries
+
+    @property
+    def total_tool_calls(self) -> int:
+        return self._total_tool_calls
+
+    @property
+    def tool_usage(self) -> Dict[str, int]:
+        return dict(self._tool_usage)
+
+    @property
+    def total_time(self) -> float:
+        return self._total_time
+
+    @property
+    def errors(self) -> int:
+        return self._errors
 
     def record_query(self, duration: float, tools_used: List[str] = None):
         """Registra una consulta al agente."""
-        self.total_queries += 1
-        self.total_time += duration
+        self._total_queries += 1
+        self._total_time += duration
+        self._dirty = True
 
         if tools_used:
-            self.total_tool_calls += len(tools_used)
-            for tool in tools_used:
-                self.tool_usage[tool] = self.tool_usage.get(tool, 0) + 1
+            self._total_tool_calls += len(tools_used)
+            self._tool_usage.update(tools_used)
 
     def record_error(self):
         """Registra un error."""
-        self.errors += 1
+        self._errors += 1
+        self._dirty = True
 
     def get_summary(self) -> Dict[str, Any]:
-        """Obtiene un resumen de las métricas."""
-        avg_time = self.total_time / self.total_queries if self.total_queries > 0 else 0
-
-        return {
-            "total_queries": self.total_queries,
-            "total_tool_calls": self.total_tool_calls,
-            "tool_usage": self.tool_usage,
-            "average_response_time": f"{avg_time:.2f}s",
-            "total_time": f"{self.total_time:.2f}s",
-            "errors": self.errors,
-            "error_rate": f"{(self.errors / self.total_queries * 100):.1f}%" if self.total_queries > 0 else "0%"
-        }
+        """Obtiene un resumen de las métricas (una copia; modificarla no afecta a la caché)."""
+        if self._dirty:
+            total = self._total_queries
+            avg_time = self._total_time / total if total > 0 else 0
+
+            self._summary_cache = {
+                "total_queries": total,
+                "total_tool_calls": self._total_tool_calls,
+                "tool_usage": dict(self._tool_usage),
+                "average_response_time": f"{avg_time:.2f}s",
+                "total_time": f"{self._total_time:.2f}s",
+                "errors": self._errors,
+                "error_rate": f"{(self._errors / total * 100):.1f}%" if total > 0 else "0%"
+            }
+            self._dirty = False
+        return {**self._summary_cache, "tool_usage": dict(self._summary_cache["tool_usage"])}
 
     def __str__(self) -> str:
         summary = self.get_summary()
@@ -0,0 +1,86 @@
+"""
+Pruebas de text_analyzer_tool.
+
+Comparan el reporte con la implementación original (text.split() y varias
+pasadas) para asegurar que el tokenizador de una sola pasada da las mismas
+estadísticas.
+"""
+
+import re
+from collections import Counter
+
+import pytest
+
+from src.tools.text_tools import text_analyzer_tool
+
+
+def _original_analysis(text: str) -> str:
+    """Implementación original de text_analyzer_tool, como referencia."""
+    text = text.strip()
+
+    char_count = len(text)
+    char_no_spaces = len(text.replace(" ", ""))
+
+    words = text.split()
+    word_count = len(words)
+
+    sentences = re.split(r'[.!?]+', text)
+    sentences = [s.strip() for s in sentences if s.strip()]
+    sentence_count = len(sentences)
+
+    paragraphs = text.split('\n\n')
+    paragraphs = [p.strip() for p in paragraphs if p.strip()]
+    paragraph_count = len(paragraphs)
+
+    longest_word = max(words, key=len) if words else ""
+
+    avg_word_length = sum(len(w) for w in words) / word_count if word_count > 0 else 0
+
+    words_lower = [w.lower().strip('.,!?;:()[]"\'') for w in words]
+    word_freq = Counter(words_lower)
+    most_common = word_freq.most_common(5)
+
+    result = f"""📊 ANÁLISIS DE TEXTO:
+
+📝 Estadísticas básicas:
+   • Caracteres (con espacios): {char_count}
+   • Caracteres (sin espacios): {char_no_spaces}
+   • Palabras: {word_count}
+   • Oraciones: {sentence_count}
+   • Párrafos: {paragraph_count}
+
+📏 Métricas:
+   • Longitud promedio de palabra: {avg_word_length:.1f} caracteres
+   • Palabra más larga: "{longest_word}" ({len(longest_word)} caracteres)
+   • Palabras por oración: {word_count / sentence_count if sentence_count else 0:.1f}
+
+🔤 Palabras más frecuentes:"""
+
+    for word, count in most_common:
+        result += f"\n   • \"{word}\": {count} veces"
+
+    return result
+
+
+TEXTS = [
+    "Hola mundo",
+    "x",
+    "supercalifragilisticoespialidoso",
+    "Hola mundo, ¿cómo estás?",
+    "The well-known café l'eau costs 3.50 euros in 2024!",
+    "Él dijo: \"no\". Ella dijo: (sí) [quizá]... ¡Bien!",
+    "uno dos dos tres tres tres cuatro cuatro cuatro cuatro cinco seis siete",
+    "Primer párrafo con texto.\n\nSegundo párrafo, con más texto.\tY tabs.",
+    "... --- !!! 123 456 123",
+    "  espacios\u00a0no separables\u2003y\u3000otros  ",
+    "Año ñandú ÁRBOL árbol Árbol arbol " * 5,
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_text_analyzer_matches_original(text):
+    assert text_analyzer_tool.invoke(text) == _original_analysis(text)
+
+
+def test_text_analyzer_empty_text():
+    assert text_analyzer_tool.invoke("   ").startswith("Error:")
@@ -1,16 +1,39 @@
-from fastapi import FastAPI
-from pydantic import BaseModel
+import os
+
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+import msgspec
 import uvicorn
 
 app = FastAPI()
 
-class BuscarInput(BaseModel):
+class BuscarInput(msgspec.Struct):
     query: str
 
+# Decodifica el JSON directamente a BuscarInput (sin pasar por Pydantic)
+_decode_buscar = msgspec.json.Decoder(BuscarInput).decode
+
+async def _buscar_body(request: Request) -> BuscarInput:
+    try:
+        return _decode_buscar(await request.body())
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+# Handler síncrono: FastAPI lo ejecuta en su threadpool, así la búsqueda
+# (bloqueante, p. ej. wikipedia_tool) no frena el event loop
 @app.post("/buscar")
-def buscar(body: BuscarInput):
+def buscar(body: BuscarInput = Depends(_buscar_body)):
     # tu lógica real aquí
-    return {"result": f"Buscaste: {body.query}"}
+    return ORJSONResponse({"result": f"Buscaste: {body.query}"})
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Un worker por núcleo; uvloop y httptools vienen con uvicorn[standard]
+    uvicorn.run(
+        "tools:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count() or 1,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
\ No newline at end of file
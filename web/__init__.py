@@ -0,0 +1,5 @@
+"""
+Aplicacion web del agente.
+
+Este modulo contiene la API FastAPI y sus modelos (ver web.app).
+"""
@@ -0,0 +1,391 @@
+"""
+API Web para el Agente Calculadora + Búsqueda.
+
+Este módulo proporciona una API REST usando FastAPI para interactuar
+con el agente desde una interfaz web.
+
+En Vercel se expone a traves de api/index.py; en local:
+    uvicorn web.app:app --reload
+"""
+
+import asyncio
+import logging
+import sys
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, TYPE_CHECKING
+from datetime import datetime, timezone
+
+import orjson
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import (
+    FileResponse,
+    JSONResponse,
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from src.agents import CalculatorSearchAgent
+
+# Raiz del proyecto; los archivos estaticos siguen en api/static
+_ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(_ROOT_DIR, "api", "static")
+STATIC_DIR_EXISTS = os.path.isdir(STATIC_DIR)
+HTML_PATH = os.path.join(STATIC_DIR, "index.html")
+HTML_SIZE = os.path.getsize(HTML_PATH) if os.path.isfile(HTML_PATH) else None
+
+# Tamano maximo del HTML que se mantiene en memoria tras la primera lectura
+HTML_CACHE_MAX_BYTES = 1024 * 1024
+_html_bytes: Optional[bytes] = None
+
+# Datos del despliegue para /api/debug: no cambian durante la vida del
+# proceso, asi que se calculan una sola vez al importar
+_DEPLOYMENT_INFO = {
+    "python_version": sys.version,
+    "cwd": os.getcwd(),
+    "file_dir": os.path.dirname(os.path.abspath(__file__)),
+    "sys_path": sys.path[:5],  # First 5 entries
+    "static_dir_exists": STATIC_DIR_EXISTS,
+    "src_dir_exists": os.path.isdir(os.path.join(_ROOT_DIR, "src")),
+}
+
+# Los modulos del agente (langchain, langgraph, dotenv, herramientas) se
+# importan en get_agent() para que los endpoints que no usan el agente no
+# paguen ese costo en el arranque en frio.
+# AGENT_AVAILABLE es None hasta el primer intento de importacion.
+AGENT_AVAILABLE: Optional[bool] = None
+IMPORT_ERROR: Optional[str] = None
+
+
+# Initialize FastAPI app
+app = FastAPI(
+    title="Agente Calculadora + Búsqueda",
+    description="API para interactuar con el agente inteligente basado en LangChain y DeepSeek",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
+
+# Compresion de respuestas; nivel 4 para no gastar CPU de mas por respuesta
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
+
+# Global agent instance
+agent: Optional["CalculatorSearchAgent"] = None
+# Evita construir varios agentes a la vez en el arranque en frio
+_agent_lock = threading.Lock()
+
+
+class ChatRequest(BaseModel):
+    """Request model for chat endpoint."""
+    message: str
+
+
+logger = logging.getLogger(__name__)
+
+# Cache LRU de respuestas del agente, indexada por mensaje normalizado.
+# Cada entrada caduca a los RESPONSE_CACHE_TTL segundos: las respuestas que
+# dependen de la hora, el clima o las noticias no se sirven desactualizadas.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+_response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _normalize_message(message: str) -> str:
+    """Normaliza un mensaje para usarlo como clave de cache."""
+    return " ".join(message.lower().split())
+
+
+def _cache_get(key: str) -> Optional[str]:
+    """Obtiene una respuesta cacheada vigente y la marca como usada recientemente."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if time.monotonic() >= expires_at:
+        _response_cache.pop(key, None)
+        return None
+    _response_cache.move_to_end(key)
+    return response
+
+
+def _cache_put(key: str, response: str) -> None:
+    """Guarda una respuesta, descartando la menos usada si se llena."""
+    if RESPONSE_CACHE_TTL <= 0:
+        return
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, response)
+    _response_cache.move_to_end(key)
+    if len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+# Ultimo timestamp ISO formateado y el segundo al que corresponde
+_last_timestamp = ""
+_last_timestamp_second = -1
+
+
+def _timestamp() -> str:
+    """
+    Timestamp ISO en UTC con resolucion de segundos para /api/health
+    (formateado una vez por segundo). Mismo formato que api/health.js.
+    """
+    global _last_timestamp, _last_timestamp_second
+    second = int(time.time())
+    if second != _last_timestamp_second:
+        _last_timestamp = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        _last_timestamp_second = second
+    return _last_timestamp
+
+
+# Respuesta de /api/tools ya serializada (se construye en la primera peticion)
+_tools_cache: Optional[bytes] = None
+
+# Tool icons mapping
+TOOL_ICONS = {
+    "calculator_tool": "📊",
+    "web_search_tool": "🔍",
+    "wikipedia_tool": "📚",
+    "datetime_tool": "📅",
+    "unit_converter_tool": "📐",
+    "text_analyzer_tool": "📝",
+    "text_transform_tool": "🔄",
+    "random_generator_tool": "🎲",
+    "weather_tool": "🌤️",
+}
+
+
+def get_agent() -> "CalculatorSearchAgent":
+    """Get or create the agent instance."""
+    if agent is not None:
+        return agent
+
+    with _agent_lock:
+        if agent is None:
+            _create_agent()
+    return agent
+
+
+def _create_agent() -> None:
+    """Import the agent modules and build the global agent (holding _agent_lock)."""
+    global agent, AGENT_AVAILABLE, IMPORT_ERROR
+
+    # Lazy imports for modules that might fail - wrap in try-except
+    try:
+        from src.agents import CalculatorSearchAgent
+        from src.config.settings import settings
+        AGENT_AVAILABLE = True
+    except ImportError as e:
+        AGENT_AVAILABLE = False
+        IMPORT_ERROR = str(e)
+
+    # Check if agent modules were imported successfully
+    if not AGENT_AVAILABLE:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Agent not available. Import error: {IMPORT_ERROR}"
+        )
+
+    try:
+        print("Validating settings...")
+        settings.validate()
+        print("Settings validated. Creating agent...")
+        agent = CalculatorSearchAgent(verbose=False)
+        print("Agent created successfully.")
+    except Exception as e:
+        print(f"CRITICAL ERROR initializing agent: {e}")
+        raise HTTPException(status_code=503, detail=f"Agent initialization failed: {str(e)}")
+
+
+@app.on_event("startup")
+async def prewarm_agent():
+    """Create the agent at startup when AGENT_PREWARM=1."""
+    if os.getenv("AGENT_PREWARM") != "1":
+        return
+    # Se ejecuta en un hilo para no bloquear el arranque del servidor ASGI
+    try:
+        await asyncio.to_thread(get_agent)
+    except HTTPException as e:
+        print(f"WARNING: Agent prewarm failed: {e.detail}")
+
+
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close the shared async HTTP clients of the tools that were loaded."""
+    # Solo se cierran los de modulos ya importados: no se cargan al apagar
+    weather = sys.modules.get("src.tools.weather_tool")
+    if weather is not None:
+        await weather.close_async_client()
+    wikipedia = sys.modules.get("src.tools.wikipedia_tool")
+    if wikipedia is not None:
+        await wikipedia.close_aio_session()
+
+
+async def _run_agent(message: str) -> str:
+    """Ejecuta un mensaje a traves del agente sin bloquear el event loop."""
+    agent = await asyncio.to_thread(get_agent)
+    # agent.run es bloqueante (LLM + herramientas): se ejecuta en un hilo
+    # para no bloquear el event loop mientras espera la respuesta.
+    return await asyncio.to_thread(agent.run, message)
+
+
+@app.get("/")
+async def root():
+    """Serve the main HTML page (local only; Vercel serves it statically)."""
+    global _html_bytes
+    try:
+        if HTML_SIZE is None:
+            return {"message": "API is running. Static files not available.", "docs": "/docs"}
+        if HTML_SIZE > HTML_CACHE_MAX_BYTES:
+            return FileResponse(HTML_PATH)
+        # El HTML se lee una sola vez y se sirve desde memoria
+        if _html_bytes is None:
+            with open(HTML_PATH, "rb") as f:
+                _html_bytes = f.read()
+        return Response(content=_html_bytes, media_type="text/html")
+    except Exception as e:
+        return {"error": str(e), "docs": "/docs"}
+
+
+@app.get("/api/health")
+async def health_check():
+    """Health check endpoint (local only; Vercel uses api/health.js)."""
+    return {"status": "healthy", "timestamp": _timestamp()}
+
+
+@app.get("/api/debug")
+async def debug_info():
+    """Debug endpoint to diagnose deployment issues."""
+    return {
+        "agent_available": AGENT_AVAILABLE,
+        "import_error": IMPORT_ERROR,
+        **_DEPLOYMENT_INFO,
+        "env_vars_set": {
+            "DEEPSEEK_API_KEY": bool(os.getenv("DEEPSEEK_API_KEY")),
+            "DEEPSEEK_MODEL": os.getenv("DEEPSEEK_MODEL", "not set"),
+        },
+    }
+
+
+@app.get("/api/tools", response_model=None)
+async def get_tools():
+    """Get available tools information."""
+    global _tools_cache
+    try:
+        # Las herramientas no cambian tras crear el agente: el JSON se
+        # construye una sola vez y se reutiliza en cada peticion.
+        if _tools_cache is None:
+            agent = get_agent()
+            tools_info = agent.get_tools_info()
+            _tools_cache = orjson.dumps([
+                {
+                    "name": tool["name"],
+                    "description": tool["description"],
+                    "icon": TOOL_ICONS.get(tool["name"], "🔧"),
+                }
+                for tool in tools_info
+            ])
+        return Response(
+            content=_tools_cache,
+            media_type="application/json",
+            headers={"Cache-Control": "public, max-age=3600"},
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/api/chat", response_model=None)
+async def chat(request: ChatRequest):
+    """Process a chat message and return the agent's response."""
+    if not request.message or request.message.isspace():
+        raise HTTPException(status_code=400, detail="El mensaje no puede estar vacío")
+    
+    try:
+        cache_key = _normalize_message(request.message)
+        response = _cache_get(cache_key)
+        if response is not None:
+            logger.debug("Response cache hit: %r", cache_key)
+        else:
+            logger.debug("Response cache miss: %r", cache_key)
+            response = await _run_agent(request.message)
+            # agent.run devuelve los errores como texto; esos no se cachean
+            if not response.startswith("Error al procesar la consulta:"):
+                _cache_put(cache_key, response)
+        # Respuesta como dict plano: sin validacion de Pydantic en la salida
+        return ORJSONResponse({
+            "response": response,
+            "timestamp": datetime.now().isoformat(),
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _message_to_step(msg) -> dict:
+    """Convierte un mensaje de langgraph en un paso serializable (sin campos None)."""
+    fields = (
+        ("type", getattr(msg, "type", None)),
+        ("content", getattr(msg, "content", None)),
+        ("tool", getattr(msg, "name", None)),
+    )
+    return {key: value for key, value in fields if value is not None}
+
+
+@app.post("/api/chat/stream")
+async def chat_with_steps(request: ChatRequest):
+    """
+    Process a chat message streaming the intermediate steps as NDJSON.
+
+    Each line is a step ({"type", "content", "tool"}); the last line is
+    {"response", "timestamp"}, or {"error"} if the agent failed.
+    """
+    if not request.message or request.message.isspace():
+        raise HTTPException(status_code=400, detail="El mensaje no puede estar vacío")
+
+    agent = get_agent()
+
+    async def generate():
+        messages = agent.stream(request.message)
+        output = ""
+        try:
+            while True:
+                # Cada paso del agente es bloqueante: se espera en un hilo
+                msg = await asyncio.to_thread(next, messages, None)
+                if msg is None:
+                    break
+                step = _message_to_step(msg)
+                if step:
+                    output = step.get("content") or output
+                    yield orjson.dumps(step) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+            return
+        yield orjson.dumps({"response": output, "timestamp": datetime.now().isoformat()}) + b"\n"
+
+    # Content-Encoding explicito para que GZipMiddleware no acumule los pasos
+    return StreamingResponse(
+        generate(),
+        media_type="application/x-ndjson",
+        headers={"Content-Encoding": "identity"},
+    )
+
+
+# Mount static files (after defining routes)
+# En Vercel los archivos estaticos, "/" y /api/health se sirven sin pasar por
+# Python (ver vercel.json), asi que el montaje solo se hace en local.
+if not os.getenv("VERCEL"):
+    try:
+        from fastapi.staticfiles import StaticFiles
+
+        if STATIC_DIR_EXISTS:
+            app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+        else:
+            print(f"WARNING: Static directory not found at {STATIC_DIR}")
+    except Exception as e:
+        print(f"WARNING: Could not mount static files: {e}")
+
+
+# Vercel auto-detects the FastAPI 'app' object
+